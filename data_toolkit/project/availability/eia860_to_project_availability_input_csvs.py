@@ -46,17 +46,21 @@ Settings
     * region
     * project_availability_scenario_id
     * project_availability_scenario_name
+    * scenarios_csv (optional; creates inputs for each study_year, region,
+      project_availability_scenario_id, and project_availability_scenario_name
+      row with a single database connection)
 
 """
 
 from argparse import ArgumentParser
+import csv
 import os.path
-import pandas as pd
 import sys
 
 from db.common_functions import connect_to_database
 from data_toolkit.project.project_data_filters_common import (
-    get_eia860_sql_filter_string,
+    get_eia860_sql_filter_params,
+    EIA860_SQL_FILTER_STR,
     VAR_GEN_FILTER_STR,
     HYDRO_FILTER_STR,
     DISAGG_PROJECT_NAME_STR,
@@ -64,6 +68,41 @@ from data_toolkit.project.project_data_filters_common import (
 )
 
 
+# The query text is built once at import; the study year and region are
+# bound as parameters (see get_eia860_sql_filter_params())
+# Apply the EIA 860 filters once in a CTE and reuse the filtered
+# generators in both branches; the branches still join to the key
+# differently (disaggregated units also match on the energy source)
+PROJECT_AVAILABILITY_SQL = f"""
+    WITH filtered_generators AS (
+        SELECT *
+        FROM raw_data_eia860_generators
+        WHERE 1 = 1
+        AND {EIA860_SQL_FILTER_STR}
+    )
+    SELECT {DISAGG_PROJECT_NAME_STR} AS project
+    FROM filtered_generators
+    JOIN user_defined_eia_gridpath_key ON
+            filtered_generators.prime_mover_code = 
+            user_defined_eia_gridpath_key.prime_mover_code
+            AND energy_source_code_1 = energy_source_code
+     WHERE 1 = 1
+     AND NOT {VAR_GEN_FILTER_STR}
+     AND NOT {HYDRO_FILTER_STR}
+    -- The two branches are mutually exclusive, so skip the DISTINCT pass
+    UNION ALL
+    -- Aggregated units include wind, offshore wind, solar, and hydro
+    SELECT {AGG_PROJECT_NAME_STR} AS project
+    FROM filtered_generators
+    JOIN user_defined_eia_gridpath_key
+    USING (prime_mover_code)
+    WHERE 1 = 1
+    AND ({VAR_GEN_FILTER_STR} OR {HYDRO_FILTER_STR})
+    -- UNION ALL does not sort, so order explicitly to keep the CSV stable
+    ORDER BY project
+    """
+
+
 def parse_arguments(args):
     """
     :param args: the script arguments specified by the user
@@ -86,6 +125,16 @@ def parse_arguments(args):
     parser.add_argument(
         "-avl_name", "--project_availability_scenario_name", default="no_derates"
     )
+    # Optionally, create inputs for multiple scenarios with one connection
+    parser.add_argument(
+        "-scenarios_csv",
+        "--scenarios_csv",
+        default=None,
+        help="CSV with study_year, region, project_availability_scenario_id, "
+        "and project_availability_scenario_name columns; if specified, the "
+        "study_year, region, and scenario ID and name arguments are ignored "
+        "and inputs are created for each row of the CSV.",
+    )
 
     parser.add_argument("-q", "--quiet", default=False, action="store_true")
 
@@ -96,50 +145,35 @@ def parse_arguments(args):
 
 def get_project_availability(
     conn,
-    eia860_sql_filter_string,
-    var_gen_filter_str,
-    hydro_filter_str,
-    disagg_project_name_str,
-    agg_project_name_str,
+    eia860_sql_filter_params,
     csv_location,
     subscenario_id,
     subscenario_name,
 ):
-    sql = f"""
-    SELECT {disagg_project_name_str} AS project, 
-    'exogenous' AS availability_type,
-    NULL AS exogenous_availability_independent_scenario_id,
-    NULL AS exogenous_availability_weather_scenario_id,
-    NULL AS endogenous_availability_scenario_id
-    FROM raw_data_eia860_generators
-    JOIN user_defined_eia_gridpath_key ON
-            raw_data_eia860_generators.prime_mover_code = 
-            user_defined_eia_gridpath_key.prime_mover_code
-            AND energy_source_code_1 = energy_source_code
-     WHERE 1 = 1
-     AND {eia860_sql_filter_string}
-     AND NOT {var_gen_filter_str}
-     AND NOT {hydro_filter_str}
-    UNION
-    -- Aggregated units include wind, offshore wind, solar, and hydro
-    SELECT {agg_project_name_str} AS project,
-        'exogenous' AS availability_type,
-    NULL AS exogenous_availability_independent_scenario_id,
-    NULL AS exogenous_availability_weather_scenario_id,
-    NULL AS endogenous_availability_scenario_id
-    FROM raw_data_eia860_generators
-    JOIN user_defined_eia_gridpath_key
-    USING (prime_mover_code)
-    WHERE 1 = 1
-    AND {eia860_sql_filter_string}
-    AND ({var_gen_filter_str} OR {hydro_filter_str})
-    """
-
-    df = pd.read_sql(sql, conn)
-    df.to_csv(
+    # Only the project names come from the database; all projects get the
+    # 'exogenous' availability type with no profiles (empty fields)
+    # Write through a 4 MB buffer to reduce the number of write calls
+    c = conn.cursor()
+    projects = c.execute(PROJECT_AVAILABILITY_SQL, eia860_sql_filter_params)
+    with open(
         os.path.join(csv_location, f"{subscenario_id}_" f"{subscenario_name}.csv"),
-        index=False,
-    )
+        "w",
+        newline="",
+        buffering=4 * 1024 * 1024,
+    ) as f:
+        writer = csv.writer(f, delimiter=",", lineterminator="\n")
+        writer.writerow(
+            [
+                "project",
+                "availability_type",
+                "exogenous_availability_independent_scenario_id",
+                "exogenous_availability_weather_scenario_id",
+                "endogenous_availability_scenario_id",
+            ]
+        )
+        writer.writerows(
+            (project, "exogenous", None, None, None) for (project,) in projects
+        )
 
 
 def main(args=None):
@@ -153,21 +187,54 @@ def main(args=None):
 
     os.makedirs(parsed_args.output_directory, exist_ok=True)
 
+    if parsed_args.scenarios_csv is None:
+        scenarios = [
+            (
+                parsed_args.study_year,
+                parsed_args.region,
+                parsed_args.project_availability_scenario_id,
+                parsed_args.project_availability_scenario_name,
+            )
+        ]
+    else:
+        with open(parsed_args.scenarios_csv, "r", newline="") as f:
+            scenarios = [
+                (
+                    row["study_year"],
+                    row["region"],
+                    row["project_availability_scenario_id"],
+                    row["project_availability_scenario_name"],
+                )
+                for row in csv.DictReader(f, delimiter=",")
+            ]
+
     conn = connect_to_database(db_path=parsed_args.database)
 
-    get_project_availability(
-        conn=conn,
-        eia860_sql_filter_string=get_eia860_sql_filter_string(
-            study_year=parsed_args.study_year, region=parsed_args.region
-        ),
-        var_gen_filter_str=VAR_GEN_FILTER_STR,
-        hydro_filter_str=HYDRO_FILTER_STR,
-        disagg_project_name_str=DISAGG_PROJECT_NAME_STR,
-        agg_project_name_str=AGG_PROJECT_NAME_STR,
-        csv_location=parsed_args.output_directory,
-        subscenario_id=parsed_args.project_availability_scenario_id,
-        subscenario_name=parsed_args.project_availability_scenario_name,
-    )
+    # These are large reads, so give SQLite a bigger page cache, keep
+    # temporary structures in memory, and memory-map the database file
+    for pragma in (
+        "cache_size=-262144",
+        "temp_store=MEMORY",
+        "mmap_size=1073741824",
+    ):
+        conn.execute(f"PRAGMA {pragma};")
+
+    # Run all scenarios in a single read transaction on the same connection,
+    # so that the page cache stays warm across scenarios
+    conn.execute("BEGIN;")
+    for study_year, region, subscenario_id, subscenario_name in scenarios:
+        get_project_availability(
+            conn=conn,
+            eia860_sql_filter_params=get_eia860_sql_filter_params(
+                study_year=study_year, region=region
+            ),
+            csv_location=parsed_args.output_directory,
+            subscenario_id=subscenario_id,
+            subscenario_name=subscenario_name,
+        )
+    conn.commit()
+
+    conn.close()
 
 
 if __name__ == "__main__":
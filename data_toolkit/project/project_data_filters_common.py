@@ -14,22 +14,36 @@
 
 
 # TODO: make it easier to include or exclude proposed
-def get_eia860_sql_filter_string(study_year, region):
-    eia860_sql_filter_string = f"""
+# The EIA 860 filter with named placeholders, so that the query text does not
+# change with the study year and region and SQLite can reuse the prepared
+# statement; bind the values from get_eia860_sql_filter_params()
+EIA860_SQL_FILTER_STR = """
     (unixepoch(current_planned_generator_operating_date) < unixepoch(
-     '{study_year}-01-01') or current_planned_generator_operating_date IS NULL)
-     AND (unixepoch(generator_retirement_date) > unixepoch('{study_year}-12-31') or generator_retirement_date IS NULL)
+     :study_year || '-01-01') or current_planned_generator_operating_date IS NULL)
+     AND (unixepoch(generator_retirement_date) > unixepoch(:study_year || '-12-31') or generator_retirement_date IS NULL)
      AND balancing_authority_code_eia in (
          SELECT baa
          FROM user_defined_baa_key
-         WHERE region = '{region}'
+         WHERE region = :region
      )
      AND operational_status_code in ('OP', 'CO')
     """
 
+
+def get_eia860_sql_filter_string(study_year, region):
+    # Same filter as EIA860_SQL_FILTER_STR with the values written into the
+    # query text, for the queries that are formatted rather than bound
+    eia860_sql_filter_string = EIA860_SQL_FILTER_STR.replace(
+        ":study_year", f"'{study_year}'"
+    ).replace(":region", f"'{region}'")
+
     return eia860_sql_filter_string
 
 
+def get_eia860_sql_filter_params(study_year, region):
+    return {"study_year": study_year, "region": region}
+
+
 FUEL_FILTER_STR = (
     """gridpath_operational_type IN ('gen_commit_bin', 'gen_commit_lin')"""
 )
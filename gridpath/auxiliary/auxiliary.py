@@ -120,15 +120,20 @@ def subset_init_by_param_value(mod, set_name, param_name, param_value):
     :param param_value:
     :return:
     """
-    return list(
-        i for i in getattr(mod, set_name) if getattr(mod, param_name)[i] == param_value
-    )
+    # Look up the param component once rather than for each set element
+    param = getattr(mod, param_name)
+    return [i for i in getattr(mod, set_name) if param[i] == param_value]
 
 
 def subset_init_by_set_membership(mod, superset, index, membership_set):
     """
     Initialize subset based on membership in another set.
+
+    The membership set is copied into a Python frozenset first, so that the
+    membership checks are plain hash lookups rather than going through the
+    Pyomo Set interface for each element of the superset.
     """
+    membership_set = frozenset(membership_set)
     return list(
         index_tuple
         for index_tuple in getattr(mod, superset)
@@ -304,9 +304,10 @@ def update_prj_zone_column(
     project_zones = c.execute(
         """SELECT project, {}
             FROM {}
-            WHERE {} = {}""".format(
-            col, subsc_tbl, subscenario, getattr(subscenarios, subscenario.upper())
-        )
+            WHERE {} = ?""".format(
+            col, subsc_tbl, subscenario
+        ),
+        (getattr(subscenarios, subscenario.upper()),),
     ).fetchall()
 
     updates = []
@@ -23,13 +23,247 @@ This module contains:
 """
 
 
+import csv
 from importlib import import_module
 import os.path
-import pandas as pd
 import sys
 import traceback
-
-from gridpath.auxiliary.auxiliary import check_for_integer_subdirectories
+from types import MappingProxyType
+
+from gridpath.auxiliary.auxiliary import is_integer
+
+# The module lists are built once at import time and the *_list() functions
+# below return these shared objects; the dictionaries are read-only views
+# with tuples as values so they can't be modified in place
+# (all_modules_list() returns a copy that callers are free to modify)
+ALL_MODULES = (
+    "temporal.operations.timepoints",
+    "temporal.investment.periods",
+    "temporal.operations.horizons",
+    "temporal.investment.superperiods",
+    "temporal.finalize",
+    "geography.load_zones",
+    "geography.load_following_up_balancing_areas",
+    "geography.load_following_down_balancing_areas",
+    "geography.regulation_up_balancing_areas",
+    "geography.regulation_down_balancing_areas",
+    "geography.frequency_response_balancing_areas",
+    "geography.spinning_reserves_balancing_areas",
+    "geography.energy_target_zones",
+    "geography.instantaneous_penetration_zones",
+    "geography.transmission_target_zones",
+    "geography.carbon_cap_zones",
+    "geography.carbon_tax_zones",
+    "geography.performance_standard_zones",
+    "geography.carbon_credits_zones",
+    "geography.fuel_burn_limit_balancing_areas",
+    "geography.generic_policy",
+    "geography.prm_zones",
+    "geography.local_capacity_zones",
+    "geography.markets",
+    "geography.water_network",
+    "system.load_balance",
+    "system.load_balance.static_load_requirement",
+    "system.policy.energy_targets",
+    "system.policy.energy_targets.period_energy_target",
+    "system.policy.energy_targets.horizon_energy_target",
+    "system.policy.instantaneous_penetration",
+    "system.policy.transmission_targets",
+    "system.policy.transmission_targets.transmission_target",
+    "system.policy.carbon_cap",
+    "system.policy.carbon_cap.carbon_cap",
+    "system.policy.carbon_tax",
+    "system.policy.carbon_tax.carbon_tax",
+    "system.policy.performance_standard",
+    "system.policy.performance_standard.performance_standard",
+    "system.policy.fuel_burn_limits",
+    "system.policy.fuel_burn_limits.fuel_burn_limits",
+    "system.policy.generic_policy",
+    "system.policy.generic_policy.generic_policy_requirements",
+    "system.reliability.prm",
+    "system.reliability.prm.prm_requirement",
+    "system.reliability.local_capacity",
+    "system.reliability.local_capacity.local_capacity_requirement",
+    "system.markets.prices",
+    "system.water.water_system_params",
+    "system.water.water_nodes",
+    "system.water.water_flows",
+    "system.water.reservoirs",
+    "system.water.water_node_balance",
+    "system.water.powerhouses",
+    "project",
+    "project.capacity",
+    "project.capacity.capacity_types",
+    "project.capacity.capacity",
+    "project.capacity.potential",
+    "project.capacity.capacity_groups",
+    "project.capacity.relative_capacity",
+    "project.capacity.costs",
+    "project.availability.availability",
+    "project.fuels",
+    "project.operations",
+    "project.operations.reserves.lf_reserves_up",
+    "project.operations.reserves.lf_reserves_down",
+    "project.operations.reserves.regulation_up",
+    "project.operations.reserves.regulation_down",
+    "project.operations.reserves.frequency_response",
+    "project.operations.reserves.spinning_reserves",
+    "project.operations.operational_types",
+    "project.operations.reserves.op_type_dependent.lf_reserves_up",
+    "project.operations.reserves.op_type_dependent.lf_reserves_down",
+    "project.operations.reserves.op_type_dependent.regulation_up",
+    "project.operations.reserves.op_type_dependent.regulation_down",
+    "project.operations.reserves.op_type_dependent.frequency_response",
+    "project.operations.reserves.op_type_dependent.spinning_reserves",
+    "project.operations.power",
+    "project.operations.cycle_select",
+    "project.operations.supplemental_firing",
+    "project.operations.cap_factor_limits",
+    "project.operations.fix_commitment",
+    "project.operations.fuel_burn",
+    "project.operations.costs",
+    "project.operations.tuning_costs",
+    "project.operations.energy_target_contributions",
+    "project.operations.instantaneous_penetration_contributions",
+    "project.operations.carbon_emissions",
+    "project.operations.carbon_cap",
+    "project.operations.carbon_tax",
+    "project.operations.performance_standard",
+    "project.operations.carbon_credits",
+    "project.reliability.prm",
+    "project.reliability.prm.prm_types",
+    "project.reliability.prm.prm_simple",
+    "project.reliability.prm.elcc_surface",
+    "project.reliability.prm.group_costs",
+    "project.reliability.local_capacity",
+    "project.reliability.local_capacity.local_capacity_contribution",
+    "project.policy.policy_contribution",
+    "project.consolidate_results",
+    "project.summary_results",
+    "transmission",
+    "transmission.capacity",
+    "transmission.capacity.capacity_types",
+    "transmission.capacity.capacity",
+    "transmission.capacity.costs",
+    "transmission.capacity.consolidate_results",
+    "transmission.capacity.capacity_groups",
+    "transmission.availability.availability",
+    "transmission.operations",
+    "transmission.operations.operational_types",
+    "transmission.operations.operations",
+    "transmission.operations.transmission_flow_limits",
+    "transmission.operations.consolidate_results",
+    "transmission.operations.hurdle_costs",
+    "transmission.operations.simultaneous_flow_limits",
+    "transmission.operations.carbon_emissions",
+    "transmission.reliability.capacity_transfer_links",
+    "transmission.operations.transmission_target_contributions",
+    "system.reserves.requirement.lf_reserves_up",
+    "system.reserves.requirement.lf_reserves_down",
+    "system.reserves.requirement.regulation_up",
+    "system.reserves.requirement.regulation_down",
+    "system.reserves.requirement.frequency_response",
+    "system.reserves.requirement.spinning_reserves",
+    "system.policy.instantaneous_penetration.instantaneous_penetration_requirements",
+    "system.load_balance.aggregate_project_power",
+    "system.load_balance.aggregate_transmission_power",
+    "transmission.operations.export_penalty_costs",
+    "system.markets.market_participation",
+    "system.markets.fix_market_participation",
+    "system.load_balance.aggregate_market_participation",
+    "system.load_balance.load_balance",
+    "system.load_balance.consolidate_results",
+    "system.reserves.aggregation.lf_reserves_up",
+    "system.reserves.aggregation.regulation_up",
+    "system.reserves.aggregation.lf_reserves_down",
+    "system.reserves.aggregation.regulation_down",
+    "system.reserves.aggregation.frequency_response",
+    "system.reserves.aggregation.spinning_reserves",
+    "system.reserves.balance.lf_reserves_up",
+    "system.reserves.balance.regulation_up",
+    "system.reserves.balance.lf_reserves_down",
+    "system.reserves.balance.regulation_down",
+    "system.reserves.balance.frequency_response",
+    "system.reserves.balance.spinning_reserves",
+    "system.policy.energy_targets.aggregate_period_energy_target_contributions",
+    "system.policy.energy_targets.aggregate_horizon_energy_target_contributions",
+    "system.policy.energy_targets.period_energy_target_balance",
+    "system.policy.energy_targets.horizon_energy_target_balance",
+    "system.policy.energy_targets.consolidate_results",
+    "system.policy.instantaneous_penetration.instantaneous_penetration_aggregation",
+    "system.policy.instantaneous_penetration.instantaneous_penetration_balance",
+    "system.policy.transmission_targets.aggregate_transmission_target_contributions",
+    "system.policy.transmission_targets.transmission_target_balance",
+    "system.policy.transmission_targets.consolidate_results",
+    "system.policy.carbon_cap.aggregate_project_carbon_emissions",
+    "system.policy.carbon_cap.aggregate_project_carbon_credits",
+    "system.policy.carbon_cap.aggregate_transmission_carbon_emissions",
+    "system.policy.carbon_cap.carbon_balance",
+    "system.policy.carbon_cap.consolidate_results",
+    "system.policy.carbon_tax.aggregate_project_carbon_emissions",
+    "system.policy.carbon_tax.aggregate_project_carbon_credits",
+    "system.policy.carbon_tax.carbon_tax_costs",
+    "system.policy.carbon_tax.consolidate_results",
+    "system.policy.subsidies",
+    "system.policy.performance_standard.aggregate_project_performance_standard",
+    "system.policy.performance_standard.aggregate_project_carbon_credits",
+    "system.policy.performance_standard.performance_standard_balance",
+    "system.policy.performance_standard.consolidate_results",
+    "system.policy.carbon_credits",
+    "system.policy.carbon_credits.aggregate_project_carbon_credits",
+    "system.policy.carbon_credits.sell_and_buy_credits",
+    "system.policy.carbon_credits.carbon_credits_balance",
+    "system.policy.carbon_credits.consolidate_results",
+    "system.policy.fuel_burn_limits.aggregate_project_fuel_burn",
+    "system.policy.fuel_burn_limits.fuel_burn_limit_balance",
+    "system.policy.fuel_burn_limits.consolidate_results",
+    "system.policy.generic_policy.aggregate_project_policy_contributions",
+    "system.policy.generic_policy.policy_target_balance",
+    "system.policy.generic_policy.consolidate_results",
+    "system.reliability.prm.aggregate_project_simple_prm_contribution",
+    "system.reliability.prm.capacity_contribution_transfers",
+    "system.reliability.prm.elcc_surface",
+    "system.reliability.prm.prm_balance",
+    "system.reliability.prm.consolidate_results",
+    "system.reliability.local_capacity.aggregate_local_capacity_contribution",
+    "system.reliability.local_capacity.local_capacity_balance",
+    "system.reliability.local_capacity.consolidate_results",
+    "system.markets.volume",
+    "objective.project.aggregate_capacity_costs",
+    "objective.project.aggregate_prm_group_costs",
+    "objective.project.aggregate_operational_costs",
+    "objective.project.aggregate_operational_tuning_costs",
+    "objective.transmission.aggregate_capacity_costs",
+    "objective.transmission.aggregate_hurdle_costs",
+    "objective.transmission.aggregate_export_penalty_costs",
+    "objective.transmission.carbon_imports_tuning_costs",
+    "objective.system.aggregate_load_balance_penalties",
+    "objective.system.reserve_violation_penalties.lf_reserves_up",
+    "objective.system.reserve_violation_penalties.lf_reserves_down",
+    "objective.system.reserve_violation_penalties.regulation_up",
+    "objective.system.reserve_violation_penalties.regulation_down",
+    "objective.system.reserve_violation_penalties.frequency_response",
+    "objective.system.reserve_violation_penalties.spinning_reserves",
+    "objective.system.policy.aggregate_period_energy_target_violation_penalties",
+    "objective.system.policy.aggregate_horizon_energy_target_violation_penalties",
+    "objective.system.policy.aggregate_transmission_target_violation_penalties",
+    "objective.system.policy.aggregate_instantaneous_penetration_violation_penalties",
+    "objective.system.policy.aggregate_carbon_cap_violation_penalties",
+    "objective.system.policy.aggregate_carbon_tax_costs",
+    "objective.system.policy.aggregate_performance_standard_violation_penalties",
+    "objective.system.policy.aggregate_fuel_burn_limit_violation_penalties",
+    "objective.system.policy.aggregate_policy_target_violation_penalties",
+    "objective.system.policy.aggregate_subsidies",
+    "objective.system.policy.aggregate_carbon_credit_sales_and_purchases",
+    "objective.system.reliability.prm.aggregate_capacity_transfer_costs",
+    "objective.system.reliability.prm.dynamic_elcc_tuning_penalties",
+    "objective.system.reliability.prm.aggregate_prm_violation_penalties",
+    "objective.system.reliability.local_capacity"
+    ".aggregate_local_capacity_violation_penalties",
+    "objective.system.aggregate_market_revenue_and_costs",
+    "objective.system.water.aggregate_flow_violation_penalty_costs",
+    "objective.max_npv",
+)
 
 
 def all_modules_list():
@@ -39,249 +273,12 @@ def all_modules_list():
     This is the list of all GridPath modules in the order they would be
     loaded if all optional features were selected.
     """
-    all_modules = [
-        "temporal.operations.timepoints",
-        "temporal.investment.periods",
-        "temporal.operations.horizons",
-        "temporal.investment.superperiods",
-        "temporal.finalize",
-        "geography.load_zones",
-        "geography.load_following_up_balancing_areas",
-        "geography.load_following_down_balancing_areas",
-        "geography.regulation_up_balancing_areas",
-        "geography.regulation_down_balancing_areas",
-        "geography.frequency_response_balancing_areas",
-        "geography.spinning_reserves_balancing_areas",
-        "geography.energy_target_zones",
-        "geography.instantaneous_penetration_zones",
-        "geography.transmission_target_zones",
-        "geography.carbon_cap_zones",
-        "geography.carbon_tax_zones",
-        "geography.performance_standard_zones",
-        "geography.carbon_credits_zones",
-        "geography.fuel_burn_limit_balancing_areas",
-        "geography.generic_policy",
-        "geography.prm_zones",
-        "geography.local_capacity_zones",
-        "geography.markets",
-        "geography.water_network",
-        "system.load_balance",
-        "system.load_balance.static_load_requirement",
-        "system.policy.energy_targets",
-        "system.policy.energy_targets.period_energy_target",
-        "system.policy.energy_targets.horizon_energy_target",
-        "system.policy.instantaneous_penetration",
-        "system.policy.transmission_targets",
-        "system.policy.transmission_targets.transmission_target",
-        "system.policy.carbon_cap",
-        "system.policy.carbon_cap.carbon_cap",
-        "system.policy.carbon_tax",
-        "system.policy.carbon_tax.carbon_tax",
-        "system.policy.performance_standard",
-        "system.policy.performance_standard.performance_standard",
-        "system.policy.fuel_burn_limits",
-        "system.policy.fuel_burn_limits.fuel_burn_limits",
-        "system.policy.generic_policy",
-        "system.policy.generic_policy.generic_policy_requirements",
-        "system.reliability.prm",
-        "system.reliability.prm.prm_requirement",
-        "system.reliability.local_capacity",
-        "system.reliability.local_capacity.local_capacity_requirement",
-        "system.markets.prices",
-        "system.water.water_system_params",
-        "system.water.water_nodes",
-        "system.water.water_flows",
-        "system.water.reservoirs",
-        "system.water.water_node_balance",
-        "system.water.powerhouses",
-        "project",
-        "project.capacity",
-        "project.capacity.capacity_types",
-        "project.capacity.capacity",
-        "project.capacity.potential",
-        "project.capacity.capacity_groups",
-        "project.capacity.relative_capacity",
-        "project.capacity.costs",
-        "project.availability.availability",
-        "project.fuels",
-        "project.operations",
-        "project.operations.reserves.lf_reserves_up",
-        "project.operations.reserves.lf_reserves_down",
-        "project.operations.reserves.regulation_up",
-        "project.operations.reserves.regulation_down",
-        "project.operations.reserves.frequency_response",
-        "project.operations.reserves.spinning_reserves",
-        "project.operations.operational_types",
-        "project.operations.reserves.op_type_dependent.lf_reserves_up",
-        "project.operations.reserves.op_type_dependent.lf_reserves_down",
-        "project.operations.reserves.op_type_dependent.regulation_up",
-        "project.operations.reserves.op_type_dependent.regulation_down",
-        "project.operations.reserves.op_type_dependent.frequency_response",
-        "project.operations.reserves.op_type_dependent.spinning_reserves",
-        "project.operations.power",
-        "project.operations.cycle_select",
-        "project.operations.supplemental_firing",
-        "project.operations.cap_factor_limits",
-        "project.operations.fix_commitment",
-        "project.operations.fuel_burn",
-        "project.operations.costs",
-        "project.operations.tuning_costs",
-        "project.operations.energy_target_contributions",
-        "project.operations.instantaneous_penetration_contributions",
-        "project.operations.carbon_emissions",
-        "project.operations.carbon_cap",
-        "project.operations.carbon_tax",
-        "project.operations.performance_standard",
-        "project.operations.carbon_credits",
-        "project.reliability.prm",
-        "project.reliability.prm.prm_types",
-        "project.reliability.prm.prm_simple",
-        "project.reliability.prm.elcc_surface",
-        "project.reliability.prm.group_costs",
-        "project.reliability.local_capacity",
-        "project.reliability.local_capacity.local_capacity_contribution",
-        "project.policy.policy_contribution",
-        "project.consolidate_results",
-        "project.summary_results",
-        "transmission",
-        "transmission.capacity",
-        "transmission.capacity.capacity_types",
-        "transmission.capacity.capacity",
-        "transmission.capacity.costs",
-        "transmission.capacity.consolidate_results",
-        "transmission.capacity.capacity_groups",
-        "transmission.availability.availability",
-        "transmission.operations",
-        "transmission.operations.operational_types",
-        "transmission.operations.operations",
-        "transmission.operations.transmission_flow_limits",
-        "transmission.operations.consolidate_results",
-        "transmission.operations.hurdle_costs",
-        "transmission.operations.simultaneous_flow_limits",
-        "transmission.operations.carbon_emissions",
-        "transmission.reliability.capacity_transfer_links",
-        "transmission.operations.transmission_target_contributions",
-        "system.reserves.requirement.lf_reserves_up",
-        "system.reserves.requirement.lf_reserves_down",
-        "system.reserves.requirement.regulation_up",
-        "system.reserves.requirement.regulation_down",
-        "system.reserves.requirement.frequency_response",
-        "system.reserves.requirement.spinning_reserves",
-        "system.policy.instantaneous_penetration.instantaneous_penetration_requirements",
-        "system.load_balance.aggregate_project_power",
-        "system.load_balance.aggregate_transmission_power",
-        "transmission.operations.export_penalty_costs",
-        "system.markets.market_participation",
-        "system.markets.fix_market_participation",
-        "system.load_balance.aggregate_market_participation",
-        "system.load_balance.load_balance",
-        "system.load_balance.consolidate_results",
-        "system.reserves.aggregation.lf_reserves_up",
-        "system.reserves.aggregation.regulation_up",
-        "system.reserves.aggregation.lf_reserves_down",
-        "system.reserves.aggregation.regulation_down",
-        "system.reserves.aggregation.frequency_response",
-        "system.reserves.aggregation.spinning_reserves",
-        "system.reserves.balance.lf_reserves_up",
-        "system.reserves.balance.regulation_up",
-        "system.reserves.balance.lf_reserves_down",
-        "system.reserves.balance.regulation_down",
-        "system.reserves.balance.frequency_response",
-        "system.reserves.balance.spinning_reserves",
-        "system.policy.energy_targets.aggregate_period_energy_target_contributions",
-        "system.policy.energy_targets.aggregate_horizon_energy_target_contributions",
-        "system.policy.energy_targets.period_energy_target_balance",
-        "system.policy.energy_targets.horizon_energy_target_balance",
-        "system.policy.energy_targets.consolidate_results",
-        "system.policy.instantaneous_penetration.instantaneous_penetration_aggregation",
-        "system.policy.instantaneous_penetration.instantaneous_penetration_balance",
-        "system.policy.transmission_targets"
-        ".aggregate_transmission_target_contributions",
-        "system.policy.transmission_targets.transmission_target_balance",
-        "system.policy.transmission_targets.consolidate_results",
-        "system.policy.carbon_cap.aggregate_project_carbon_emissions",
-        "system.policy.carbon_cap.aggregate_project_carbon_credits",
-        "system.policy.carbon_cap.aggregate_transmission_carbon_emissions",
-        "system.policy.carbon_cap.carbon_balance",
-        "system.policy.carbon_cap.consolidate_results",
-        "system.policy.carbon_tax.aggregate_project_carbon_emissions",
-        "system.policy.carbon_tax.aggregate_project_carbon_credits",
-        "system.policy.carbon_tax.carbon_tax_costs",
-        "system.policy.carbon_tax.consolidate_results",
-        "system.policy.subsidies",
-        "system.policy.performance_standard.aggregate_project_performance_standard",
-        "system.policy.performance_standard.aggregate_project_carbon_credits",
-        "system.policy.performance_standard.performance_standard_balance",
-        "system.policy.performance_standard.consolidate_results",
-        "system.policy.carbon_credits",
-        "system.policy.carbon_credits.aggregate_project_carbon_credits",
-        "system.policy.carbon_credits.sell_and_buy_credits",
-        "system.policy.carbon_credits.carbon_credits_balance",
-        "system.policy.carbon_credits.consolidate_results",
-        "system.policy.fuel_burn_limits.aggregate_project_fuel_burn",
-        "system.policy.fuel_burn_limits.fuel_burn_limit_balance",
-        "system.policy.fuel_burn_limits.consolidate_results",
-        "system.policy.generic_policy.aggregate_project_policy_contributions",
-        "system.policy.generic_policy.policy_target_balance",
-        "system.policy.generic_policy.consolidate_results",
-        "system.reliability.prm.aggregate_project_simple_prm_contribution",
-        "system.reliability.prm.capacity_contribution_transfers",
-        "system.reliability.prm.elcc_surface",
-        "system.reliability.prm.prm_balance",
-        "system.reliability.prm.consolidate_results",
-        "system.reliability.local_capacity.aggregate_local_capacity_contribution",
-        "system.reliability.local_capacity.local_capacity_balance",
-        "system.reliability.local_capacity.consolidate_results",
-        "system.markets.volume",
-        "objective.project.aggregate_capacity_costs",
-        "objective.project.aggregate_prm_group_costs",
-        "objective.project.aggregate_operational_costs",
-        "objective.project.aggregate_operational_tuning_costs",
-        "objective.transmission.aggregate_capacity_costs",
-        "objective.transmission.aggregate_hurdle_costs",
-        "objective.transmission.aggregate_export_penalty_costs",
-        "objective.transmission.carbon_imports_tuning_costs",
-        "objective.system.aggregate_load_balance_penalties",
-        "objective.system.reserve_violation_penalties.lf_reserves_up",
-        "objective.system.reserve_violation_penalties.lf_reserves_down",
-        "objective.system.reserve_violation_penalties.regulation_up",
-        "objective.system.reserve_violation_penalties.regulation_down",
-        "objective.system.reserve_violation_penalties.frequency_response",
-        "objective.system.reserve_violation_penalties.spinning_reserves",
-        "objective.system.policy.aggregate_period_energy_target_violation_penalties",
-        "objective.system.policy"
-        ".aggregate_horizon_energy_target_violation_penalties",
-        "objective.system.policy.aggregate_transmission_target_violation_penalties",
-        "objective.system.policy.aggregate_instantaneous_penetration_violation_penalties",
-        "objective.system.policy.aggregate_carbon_cap_violation_penalties",
-        "objective.system.policy.aggregate_carbon_tax_costs",
-        "objective.system.policy.aggregate_performance_standard_violation_penalties",
-        "objective.system.policy.aggregate_fuel_burn_limit_violation_penalties",
-        "objective.system.policy.aggregate_policy_target_violation_penalties",
-        "objective.system.policy.aggregate_subsidies",
-        "objective.system.policy.aggregate_carbon_credit_sales_and_purchases",
-        "objective.system.reliability.prm.aggregate_capacity_transfer_costs",
-        "objective.system.reliability.prm.dynamic_elcc_tuning_penalties",
-        "objective.system.reliability.prm.aggregate_prm_violation_penalties",
-        "objective.system.reliability.local_capacity"
-        ".aggregate_local_capacity_violation_penalties",
-        "objective.system.aggregate_market_revenue_and_costs",
-        "objective.system.water.aggregate_flow_violation_penalty_costs",
-        "objective.max_npv",
-    ]
-    return all_modules
+    return list(ALL_MODULES)
 
 
-def optional_modules_list():
-    """
-    :return: dictionary with the optional feature names as keys and a list
-        of the modules included in each feature as values
-
-    These are all of GridPath's optional modules grouped by features (features
-    as the dictionary keys). Each of these modules belongs to only one feature.
-    """
-    optional_modules = {
-        "transmission": [
+OPTIONAL_MODULES = MappingProxyType(
+    {
+        "transmission": (
             "transmission",
             "transmission.capacity",
             "transmission.capacity.capacity_types",
@@ -299,8 +296,8 @@ def optional_modules_list():
             "transmission.operations.export_penalty_costs",
             "objective.transmission.aggregate_capacity_costs",
             "objective.transmission.aggregate_export_penalty_costs",
-        ],
-        "lf_reserves_up": [
+        ),
+        "lf_reserves_up": (
             "geography.load_following_up_balancing_areas",
             "system.reserves.requirement.lf_reserves_up",
             "project.operations.reserves.lf_reserves_up",
@@ -308,8 +305,8 @@ def optional_modules_list():
             "system.reserves.aggregation.lf_reserves_up",
             "system.reserves.balance.lf_reserves_up",
             "objective.system.reserve_violation_penalties.lf_reserves_up",
-        ],
-        "lf_reserves_down": [
+        ),
+        "lf_reserves_down": (
             "geography.load_following_down_balancing_areas",
             "system.reserves.requirement.lf_reserves_down",
             "project.operations.reserves.lf_reserves_down",
@@ -317,8 +314,8 @@ def optional_modules_list():
             "system.reserves.aggregation.lf_reserves_down",
             "system.reserves.balance.lf_reserves_down",
             "objective.system.reserve_violation_penalties.lf_reserves_down",
-        ],
-        "regulation_up": [
+        ),
+        "regulation_up": (
             "geography.regulation_up_balancing_areas",
             "system.reserves.requirement.regulation_up",
             "project.operations.reserves.regulation_up",
@@ -326,8 +323,8 @@ def optional_modules_list():
             "system.reserves.aggregation.regulation_up",
             "system.reserves.balance.regulation_up",
             "objective.system.reserve_violation_penalties.regulation_up",
-        ],
-        "regulation_down": [
+        ),
+        "regulation_down": (
             "geography.regulation_down_balancing_areas",
             "system.reserves.requirement.regulation_down",
             "project.operations.reserves.regulation_down",
@@ -335,8 +332,8 @@ def optional_modules_list():
             "project.operations.reserves.op_type_dependent.regulation_down",
             "system.reserves.balance.regulation_down",
             "objective.system.reserve_violation_penalties.regulation_down",
-        ],
-        "frequency_response": [
+        ),
+        "frequency_response": (
             "geography.frequency_response_balancing_areas",
             "system.reserves.requirement.frequency_response",
             "project.operations.reserves.frequency_response",
@@ -344,8 +341,8 @@ def optional_modules_list():
             "system.reserves.aggregation.frequency_response",
             "system.reserves.balance.frequency_response",
             "objective.system.reserve_violation_penalties.frequency_response",
-        ],
-        "spinning_reserves": [
+        ),
+        "spinning_reserves": (
             "geography.spinning_reserves_balancing_areas",
             "system.reserves.requirement.spinning_reserves",
             "project.operations.reserves.spinning_reserves",
@@ -353,32 +350,32 @@ def optional_modules_list():
             "system.reserves.aggregation.spinning_reserves",
             "system.reserves.balance.spinning_reserves",
             "objective.system.reserve_violation_penalties.spinning_reserves",
-        ],
-        "period_energy_target": [
+        ),
+        "period_energy_target": (
             "system.policy.energy_targets.period_energy_target",
             "system.policy.energy_targets"
             ".aggregate_period_energy_target_contributions",
             "system.policy.energy_targets.period_energy_target_balance",
             "objective.system.policy"
             ".aggregate_period_energy_target_violation_penalties",
-        ],
-        "horizon_energy_target": [
+        ),
+        "horizon_energy_target": (
             "system.policy.energy_targets.horizon_energy_target",
             "system.policy.energy_targets"
             ".aggregate_horizon_energy_target_contributions",
             "system.policy.energy_targets.horizon_energy_target_balance",
             "objective.system.policy"
             ".aggregate_horizon_energy_target_violation_penalties",
-        ],
-        "instantaneous_penetration": [
+        ),
+        "instantaneous_penetration": (
             "geography.instantaneous_penetration_zones",
             "system.policy.instantaneous_penetration.instantaneous_penetration_requirements",
             "project.operations.instantaneous_penetration_contributions",
             "system.policy.instantaneous_penetration.instantaneous_penetration_aggregation",
             "system.policy.instantaneous_penetration.instantaneous_penetration_balance",
             "objective.system.policy.aggregate_instantaneous_penetration_violation_penalties",
-        ],
-        "transmission_target": [
+        ),
+        "transmission_target": (
             "system.policy.transmission_targets.transmission_target",
             "system.policy.transmission_targets",
             "system.policy.transmission_targets"
@@ -387,8 +384,8 @@ def optional_modules_list():
             "system.policy.transmission_targets.consolidate_results",
             "objective.system.policy"
             ".aggregate_transmission_target_violation_penalties",
-        ],
-        "carbon_cap": [
+        ),
+        "carbon_cap": (
             "geography.carbon_cap_zones",
             "system.policy.carbon_cap",
             "system.policy.carbon_cap.carbon_cap",
@@ -397,8 +394,8 @@ def optional_modules_list():
             "system.policy.carbon_cap.carbon_balance",
             "objective.system.policy.aggregate_carbon_cap_violation_penalties",
             "system.policy.carbon_cap.consolidate_results",
-        ],
-        "carbon_tax": [
+        ),
+        "carbon_tax": (
             "geography.carbon_tax_zones",
             "system.policy.carbon_tax",
             "system.policy.carbon_tax.carbon_tax",
@@ -407,8 +404,8 @@ def optional_modules_list():
             "system.policy.carbon_tax.carbon_tax_costs",
             "system.policy.carbon_tax.consolidate_results",
             "objective.system.policy.aggregate_carbon_tax_costs",
-        ],
-        "performance_standard": [
+        ),
+        "performance_standard": (
             "geography.performance_standard_zones",
             "system.policy.performance_standard",
             "system.policy.performance_standard.performance_standard",
@@ -417,8 +414,8 @@ def optional_modules_list():
             "system.policy.performance_standard.performance_standard_balance",
             "system.policy.performance_standard.consolidate_results",
             "objective.system.policy.aggregate_performance_standard_violation_penalties",
-        ],
-        "carbon_credits": [
+        ),
+        "carbon_credits": (
             "geography.carbon_credits_zones",
             "project.operations.carbon_credits",
             "system.policy.carbon_credits",
@@ -427,8 +424,8 @@ def optional_modules_list():
             "system.policy.carbon_credits.carbon_credits_balance",
             "system.policy.carbon_credits.consolidate_results",
             "objective.system.policy.aggregate_carbon_credit_sales_and_purchases",
-        ],
-        "fuel_burn_limit": [
+        ),
+        "fuel_burn_limit": (
             "geography.fuel_burn_limit_balancing_areas",
             "system.policy.fuel_burn_limits",
             "system.policy.fuel_burn_limits.fuel_burn_limits",
@@ -436,12 +433,12 @@ def optional_modules_list():
             "system.policy.fuel_burn_limits.fuel_burn_limit_balance",
             "system.policy.fuel_burn_limits.consolidate_results",
             "objective.system.policy.aggregate_fuel_burn_limit_violation_penalties",
-        ],
-        "subsidies": [
+        ),
+        "subsidies": (
             "system.policy.subsidies",
             "objective.system.policy.aggregate_subsidies",
-        ],
-        "policy": [
+        ),
+        "policy": (
             "geography.generic_policy",
             "system.policy.generic_policy",
             "system.policy.generic_policy.generic_policy_requirements",
@@ -450,8 +447,8 @@ def optional_modules_list():
             "system.policy.generic_policy.policy_target_balance",
             "objective.system.policy.aggregate_policy_target_violation_penalties",
             "system.policy.generic_policy.consolidate_results",
-        ],
-        "prm": [
+        ),
+        "prm": (
             "geography.prm_zones",
             "system.reliability.prm",
             "system.reliability.prm.prm_requirement",
@@ -462,8 +459,8 @@ def optional_modules_list():
             "system.reliability.prm.prm_balance",
             "system.reliability.prm.consolidate_results",
             "objective.system.reliability.prm.aggregate_prm_violation_penalties",
-        ],
-        "local_capacity": [
+        ),
+        "local_capacity": (
             "geography.local_capacity_zones",
             "system.reliability.local_capacity",
             "system.reliability.local_capacity.local_capacity_requirement",
@@ -475,16 +472,16 @@ def optional_modules_list():
             "system.reliability.local_capacity.consolidate_results",
             "objective.system.reliability.local_capacity"
             ".aggregate_local_capacity_violation_penalties",
-        ],
-        "markets": [
+        ),
+        "markets": (
             "geography.markets",
             "system.markets.prices",
             "system.markets.market_participation",
             "system.markets.volume",
             "system.load_balance.aggregate_market_participation",
             "objective.system.aggregate_market_revenue_and_costs",
-        ],
-        "water": [
+        ),
+        "water": (
             "geography.water_network",
             "system.water.water_system_params",
             "system.water.water_nodes",
@@ -493,109 +490,180 @@ def optional_modules_list():
             "system.water.water_flows",
             "system.water.powerhouses",
             "objective.system.water.aggregate_flow_violation_penalty_costs",
-        ],
-        "tuning": [
+        ),
+        "tuning": (
             "project.operations.tuning_costs",
             "objective.project.aggregate_operational_tuning_costs",
-        ],
+        ),
     }
-    return optional_modules
+)
 
 
-def cross_feature_modules_list():
+def optional_modules_list():
     """
-    :return: dictionary with a tuple of features as keys and a list of
-        modules to be included if all those features are selected as values
+    :return: dictionary with the optional feature names as keys and a tuple
+        of the modules included in each feature as values
 
-    Some modules depend on more than one feature, i.e. they are included
-    only if multiple features are selected. These relationships are
-    described in the 'cross_modules' dictionary here.
+    These are all of GridPath's optional modules grouped by features (features
+    as the dictionary keys). Each of these modules belongs to only one feature.
     """
-    cross_modules = {
-        ("transmission", "transmission_hurdle_rates"): [
+    return OPTIONAL_MODULES
+
+
+CROSS_FEATURE_MODULES = MappingProxyType(
+    {
+        ("transmission", "transmission_hurdle_rates"): (
             "transmission.operations.hurdle_costs",
             "objective.transmission.aggregate_hurdle_costs",
-        ],
-        ("transmission", "carbon_cap", "track_carbon_imports"): [
+        ),
+        ("transmission", "carbon_cap", "track_carbon_imports"): (
             "system.policy.carbon_cap" ".aggregate_transmission_carbon_emissions",
             "transmission.operations.carbon_emissions",
-        ],
-        ("transmission", "carbon_cap", "track_carbon_imports", "tuning"): [
-            "objective.transmission.carbon_imports_tuning_costs"
-        ],
-        ("transmission", "simultaneous_flow_limits"): [
-            "transmission.operations.simultaneous_flow_limits"
-        ],
-        ("transmission", "prm", "capacity_transfers"): [
+        ),
+        ("transmission", "carbon_cap", "track_carbon_imports", "tuning"): (
+            "objective.transmission.carbon_imports_tuning_costs",
+        ),
+        ("transmission", "simultaneous_flow_limits"): (
+            "transmission.operations.simultaneous_flow_limits",
+        ),
+        ("transmission", "prm", "capacity_transfers"): (
             "transmission.reliability.capacity_transfer_links",
             "system.reliability.prm.capacity_contribution_transfers",
             "objective.system.reliability.prm.aggregate_capacity_transfer_costs",
-        ],
-        ("prm", "elcc_surface"): [
+        ),
+        ("prm", "elcc_surface"): (
             "project.reliability.prm.elcc_surface",
             "system.reliability.prm.elcc_surface",
-        ],
-        ("prm", "deliverability"): [
+        ),
+        ("prm", "deliverability"): (
             "project.reliability.prm.group_costs",
             "objective.project.aggregate_prm_group_costs",
-        ],
-        ("prm", "elcc_surface", "tuning"): [
-            "objective.system.reliability.prm.dynamic_elcc_tuning_penalties"
-        ],
-        ("carbon_cap", "carbon_credits"): [
+        ),
+        ("prm", "elcc_surface", "tuning"): (
+            "objective.system.reliability.prm.dynamic_elcc_tuning_penalties",
+        ),
+        ("carbon_cap", "carbon_credits"): (
             "system.policy.carbon_cap.aggregate_project_carbon_credits",
-        ],
-        ("performance_standard", "carbon_credits"): [
+        ),
+        ("performance_standard", "carbon_credits"): (
             "system.policy.performance_standard.aggregate_project_carbon_credits",
-        ],
-        ("carbon_tax", "carbon_credits"): [
+        ),
+        ("carbon_tax", "carbon_credits"): (
             "system.policy.carbon_tax.aggregate_project_carbon_credits",
-        ],
+        ),
     }
-    return cross_modules
+)
 
 
-def stage_feature_module_list():
+def cross_feature_modules_list():
     """
-    :return: dictionary with a features as keys and a list of modules to be included
-    if those features are selected AND there are stages as values
+    :return: dictionary with a tuple of features as keys and a tuple of
+        modules to be included if all those features are selected as values
+
+    Some modules depend on more than one feature, i.e. they are included
+    only if multiple features are selected. These relationships are
+    described in the CROSS_FEATURE_MODULES dictionary.
     """
-    stage_feature_modules = {"markets": ["system.markets.fix_market_participation"]}
+    return CROSS_FEATURE_MODULES
 
-    return stage_feature_modules
 
+STAGE_FEATURE_MODULES = MappingProxyType(
+    {"markets": ("system.markets.fix_market_participation",)}
+)
 
-def feature_shared_modules_list():
+
+def stage_feature_module_list():
     """
-    :return: dictionary with a tuple of features as keys and a list of
-        modules to be included if either of those features is selected as
-        values
+    :return: dictionary with a features as keys and a tuple of modules to be included
+    if those features are selected AND there are stages as values
     """
-    shared_modules = {
-        ("period_energy_target", "horizon_energy_target"): [
+    return STAGE_FEATURE_MODULES
+
+
+FEATURE_SHARED_MODULES = MappingProxyType(
+    {
+        ("period_energy_target", "horizon_energy_target"): (
             "geography.energy_target_zones",
             "project.operations.energy_target_contributions",
             "system.policy.energy_targets",
             "system.policy.energy_targets.consolidate_results",
-        ],
-        ("transmission_target", "horizon_transmission_target"): [
+        ),
+        ("transmission_target", "horizon_transmission_target"): (
             "geography.transmission_target_zones",
             "transmission.operations.transmission_target_contributions",
-        ],
+        ),
     }
+)
+
+
+def feature_shared_modules_list():
+    """
+    :return: dictionary with a tuple of features as keys and a tuple of
+        modules to be included if either of those features is selected as
+        values
+    """
+    return FEATURE_SHARED_MODULES
+
 
-    return shared_modules
+FEATURE_REMOVE_MODULES = MappingProxyType({})
 
 
 def feature_remove_modules_list():
     """
-    :return: dictionary with the feature name as keys and a list of modules to be
+    :return: dictionary with the feature name as keys and a tuple of modules to be
     excluded if the feature is selected
     """
+    return FEATURE_REMOVE_MODULES
+
+
+# Each feature's (or feature group's) modules as frozen sets, built once for
+# the set operations in determine_modules()
+_OPTIONAL_MODULE_SETS = {
+    feature: frozenset(modules) for feature, modules in OPTIONAL_MODULES.items()
+}
+_FEATURE_SHARED_MODULE_SETS = {
+    feature_group: frozenset(modules)
+    for feature_group, modules in FEATURE_SHARED_MODULES.items()
+}
+_CROSS_FEATURE_MODULE_SETS = {
+    feature_group: frozenset(modules)
+    for feature_group, modules in CROSS_FEATURE_MODULES.items()
+}
+_STAGE_FEATURE_MODULE_SETS = {
+    feature: frozenset(modules) for feature, modules in STAGE_FEATURE_MODULES.items()
+}
+_FEATURE_REMOVE_MODULE_SETS = {
+    feature: frozenset(modules) for feature, modules in FEATURE_REMOVE_MODULES.items()
+}
+
+
+def _has_stage_subdirectories(scenario_directory):
+    """
+    :param scenario_directory: the scenario directory
+    :return: True if any integer subproblem subdirectory of the scenario
+        directory has integer stage subdirectories, False otherwise
 
-    feature_remove_modules = {}
+    Scan the subproblem directories and stop at the first stage directory
+    found. The directory entries from os.scandir() cache the file type,
+    so we don't need additional stat calls.
+    """
+    # os.scandir(None) would list the current working directory
+    if scenario_directory is None:
+        raise IOError(
+            """Need to specify either 'scenario_directory', the
+                      directory to check for stage subdirectories, or
+                      'multi_stage'"""
+        )
 
-    return feature_remove_modules
+    with os.scandir(scenario_directory) as subproblems:
+        for subproblem in subproblems:
+            if is_integer(subproblem.name) and subproblem.is_dir():
+                with os.scandir(subproblem.path) as stages:
+                    for stage in stages:
+                        if is_integer(stage.name) and stage.is_dir():
+                            return True
+
+    return False
 
 
 def determine_modules(
@@ -645,7 +713,10 @@ def determine_modules(
     elif scenario_directory is not None:
         features_file = os.path.join(scenario_directory, "features.csv")
         try:
-            requested_features = pd.read_csv(features_file)["features"].tolist()
+            with open(features_file, "r", newline="") as f:
+                requested_features = [
+                    row["features"] for row in csv.DictReader(f, delimiter=",")
+                ]
         except IOError:
             print(
                 "ERROR! Features file {} not found in {}.".format(
@@ -654,9 +725,13 @@ def determine_modules(
             )
             sys.exit(1)
 
+    # We only do membership checks on the requested features below
+    requested_features = frozenset(requested_features)
+
     # Remove any modules not requested by user
-    # Start with the list of all modules
-    modules_to_use = all_modules_list()
+    # We first collect the modules to remove and then filter the list of all
+    # modules in a single pass, preserving the loading order
+    modules_to_remove = set()
 
     # If we haven't explicitly specified whether this is a multi-stages
     # scenario, check the scenario directory to determine whether we have
@@ -665,23 +740,9 @@ def determine_modules(
     # Also remove the "fix variables modules" if the multi_stage argument is False
     remove_fix_variable_modules = False
     if multi_stage is None:
-        subproblems = check_for_integer_subdirectories(scenario_directory)
-        # Check if we have subproblems
-        if subproblems:
-            # If so, check if there are stages in the subproblem
-            for subproblem in subproblems:
-                stages = check_for_integer_subdirectories(
-                    os.path.join(scenario_directory, subproblem)
-                )
-                # If we find stages in any subproblem, break out of the loop
-                # and keep the "fix variables" modules
-                if stages:
-                    break
-            else:
-                remove_fix_variable_modules = True
-        # If we make it here, we didn't find subproblems so we'll remove the
-        # "fix variables" modules
-        else:
+        # If we don't find stages in any subproblem, we'll remove the "fix
+        # variables" modules
+        if not _has_stage_subdirectories(scenario_directory):
             remove_fix_variable_modules = True
     # If multi_stages has been specified explicitly, decide whether to
     # remove the "fix variables" modules based on the value specified
@@ -689,46 +750,43 @@ def determine_modules(
         remove_fix_variable_modules = True
 
     if remove_fix_variable_modules:
-        modules_to_use.remove("project.operations.fix_commitment")
-        modules_to_use.remove("system.markets.fix_market_participation")
+        modules_to_remove.update(
+            [
+                "project.operations.fix_commitment",
+                "system.markets.fix_market_participation",
+            ]
+        )
 
     # Remove modules associated with features that are not requested
-    optional_modules = optional_modules_list()
-    for feature in list(optional_modules.keys()):
+    for feature, modules in _OPTIONAL_MODULE_SETS.items():
         if feature not in requested_features:
-            for m in optional_modules[feature]:
-                modules_to_use.remove(m)
+            modules_to_remove |= modules
 
     # Remove shared modules if none of the features sharing those modules is
     # requested
-    shared_modules = feature_shared_modules_list()
-    for feature_group in shared_modules.keys():
-        if not any(feature in requested_features for feature in feature_group):
-            for m in shared_modules[feature_group]:
-                modules_to_use.remove(m)
+    for feature_group, modules in _FEATURE_SHARED_MODULE_SETS.items():
+        if requested_features.isdisjoint(feature_group):
+            modules_to_remove |= modules
 
     # Some modules depend on more than one feature
     # We have to check if all features that the module depends on are
     # specified before removing it
-    cross_feature_modules = cross_feature_modules_list()
-    for feature_group in list(cross_feature_modules.keys()):
-        if not all(feature in requested_features for feature in feature_group):
-            for m in cross_feature_modules[feature_group]:
-                modules_to_use.remove(m)
+    for feature_group, modules in _CROSS_FEATURE_MODULE_SETS.items():
+        if not requested_features.issuperset(feature_group):
+            modules_to_remove |= modules
 
     # Remove "fix variables" modules, which should not be included when the feature is
     # not included even when there are stages
-    stage_feature_modules = stage_feature_module_list()
-    for feature in stage_feature_modules:
-        if feature not in requested_features and not remove_fix_variable_modules:
-            for m in stage_feature_modules[feature]:
-                modules_to_use.remove(m)
+    for feature, modules in _STAGE_FEATURE_MODULE_SETS.items():
+        if feature not in requested_features:
+            modules_to_remove |= modules
 
     # Remove modules features explicitly ask to remove
-    for feature in feature_remove_modules_list().keys():
+    for feature, modules in _FEATURE_REMOVE_MODULE_SETS.items():
         if feature in requested_features:
-            for m in feature_remove_modules_list()[feature]:
-                modules_to_use.remove(m)
+            modules_to_remove |= modules
+
+    modules_to_use = [m for m in ALL_MODULES if m not in modules_to_remove]
 
     return modules_to_use
 
@@ -106,12 +106,12 @@ def get_inputs_from_database(
 
     c = conn.cursor()
     spinning_reserves_bas = c.execute(
-        """SELECT spinning_reserves_ba, allow_violation,
-           violation_penalty_per_mw, reserve_to_energy_adjustment
+        """SELECT spinning_reserves_ba, COALESCE(allow_violation, '.'),
+           COALESCE(violation_penalty_per_mw, '.'),
+           COALESCE(reserve_to_energy_adjustment, '.')
            FROM inputs_geography_spinning_reserves_bas
-           WHERE spinning_reserves_ba_scenario_id = {};""".format(
-            subscenarios.SPINNING_RESERVES_BA_SCENARIO_ID
-        )
+           WHERE spinning_reserves_ba_scenario_id = ?;""",
+        (subscenarios.SPINNING_RESERVES_BA_SCENARIO_ID,),
     )
 
     return spinning_reserves_bas
@@ -212,6 +212,5 @@ def write_model_inputs(
             ]
         )
 
-        for row in spinning_reserves_bas:
-            replace_nulls = ["." if i is None else i for i in row]
-            writer.writerow(replace_nulls)
+        # NULLs are already replaced with "." in the query
+        writer.writerows(spinning_reserves_bas)
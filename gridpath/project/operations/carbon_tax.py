@@ -16,13 +16,14 @@
 
 """
 
+from collections import defaultdict
 import csv
+import itertools
 import os.path
 import pandas as pd
 from pyomo.environ import Param, Set, NonNegativeReals, Expression, value, PositiveReals
 
 from gridpath.auxiliary.auxiliary import (
-    cursor_to_df,
     subset_init_by_param_value,
     subset_init_by_set_membership,
 )
@@ -137,15 +138,8 @@ def add_model_components(
 
     m.CARBON_TAX_PRJ_FUEL_GROUP_OPR_TMPS = Set(
         dimen=3,
-        initialize=lambda mod: sorted(
-            list(
-                set(
-                    (g, fg, tmp)
-                    for (g, tmp) in mod.CARBON_TAX_PRJ_OPR_TMPS
-                    for _g, fg, f in mod.FUEL_PRJ_FUELS_FUEL_GROUP
-                    if g == _g
-                ),
-            )
+        initialize=lambda mod: prj_fuel_group_opr_idx_init(
+            mod=mod, prj_opr_set="CARBON_TAX_PRJ_OPR_TMPS"
         ),
     )
 
@@ -161,15 +155,8 @@ def add_model_components(
 
     m.CARBON_TAX_PRJ_FUEL_GROUP_OPR_PRDS = Set(
         dimen=3,
-        initialize=lambda mod: sorted(
-            list(
-                set(
-                    (g, fg, p)
-                    for (g, p) in mod.CARBON_TAX_PRJ_OPR_PRDS
-                    for _g, fg, f in mod.FUEL_PRJ_FUELS_FUEL_GROUP
-                    if g == _g
-                ),
-            )
+        initialize=lambda mod: prj_fuel_group_opr_idx_init(
+            mod=mod, prj_opr_set="CARBON_TAX_PRJ_OPR_PRDS"
         ),
     )
 
@@ -217,6 +204,28 @@ def add_model_components(
     )
 
 
+# Set Rules
+###############################################################################
+
+
+def prj_fuel_group_opr_idx_init(mod, prj_opr_set):
+    """
+    Get the project-fuel_group-timepoint (or period) combinations for the
+    project-timepoint (or period) combinations in *prj_opr_set*. We index the
+    fuel groups by project first, so that we don't have to scan all
+    project-fuel-fuel_group combinations for each project-timepoint.
+    """
+    fuel_groups_by_prj = defaultdict(set)
+    for prj, fg, f in mod.FUEL_PRJ_FUELS_FUEL_GROUP:
+        fuel_groups_by_prj[prj].add(fg)
+
+    return sorted(
+        (prj, fg, idx)
+        for (prj, idx) in getattr(mod, prj_opr_set)
+        for fg in fuel_groups_by_prj.get(prj, ())
+    )
+
+
 # Input-Output
 ###############################################################################
 
@@ -390,13 +399,13 @@ def get_inputs_from_database(
         -- Get projects from portfolio only
         (SELECT project
             FROM inputs_project_portfolios
-            WHERE project_portfolio_scenario_id = {}
+            WHERE project_portfolio_scenario_id = ?
         ) as prj_tbl
         LEFT OUTER JOIN 
         -- Get carbon tax zones for those projects
         (SELECT project, carbon_tax_zone
             FROM inputs_project_carbon_tax_zones
-            WHERE project_carbon_tax_zone_scenario_id = {}
+            WHERE project_carbon_tax_zone_scenario_id = ?
         ) as prj_ct_zone_tbl
         USING (project)
         -- Filter out projects whose carbon tax zone is not one included in 
@@ -404,13 +413,14 @@ def get_inputs_from_database(
         WHERE carbon_tax_zone in (
                 SELECT carbon_tax_zone
                     FROM inputs_geography_carbon_tax_zones
-                    WHERE carbon_tax_zone_scenario_id = {}
+                    WHERE carbon_tax_zone_scenario_id = ?
         );
-        """.format(
+        """,
+        (
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
             subscenarios.PROJECT_CARBON_TAX_ZONE_SCENARIO_ID,
             subscenarios.CARBON_TAX_ZONE_SCENARIO_ID,
-        )
+        ),
     )
 
     c2 = conn.cursor()
@@ -424,7 +434,7 @@ def get_inputs_from_database(
             INNER JOIN
                 (SELECT project, project_fuel_scenario_id
                     FROM inputs_project_operational_chars
-                    WHERE project_operational_chars_scenario_id = {}
+                    WHERE project_operational_chars_scenario_id = ?
                 ) AS op_char
                 USING(project)
             INNER JOIN
@@ -433,35 +443,36 @@ def get_inputs_from_database(
             INNER JOIN
                 (SELECT fuel, fuel_group
                     FROM inputs_fuels
-                    WHERE fuel_scenario_id = {}
+                    WHERE fuel_scenario_id = ?
                 ) AS fuel_chars
                 USING(fuel) 
-            WHERE project_portfolio_scenario_id = {}
+            WHERE project_portfolio_scenario_id = ?
         ) as prj_fuels_tbl
         CROSS JOIN
             (SELECT period
             FROM inputs_temporal_periods
-            WHERE temporal_scenario_id = {}) as relevant_periods 
+            WHERE temporal_scenario_id = ?) as relevant_periods 
         LEFT OUTER JOIN
         -- Get carbon tax allowance for those projects
             (SELECT project, period, fuel_group,
             carbon_tax_allowance_tco2_per_mwh
             FROM inputs_project_carbon_tax_allowance
-            WHERE project_carbon_tax_allowance_scenario_id = {}) as prj_ct_allowance_tbl
+            WHERE project_carbon_tax_allowance_scenario_id = ?) as prj_ct_allowance_tbl
         USING (project, fuel_group, period)
         WHERE project in (
                 SELECT project
                     FROM inputs_project_carbon_tax_zones
-                    WHERE project_carbon_tax_zone_scenario_id = {}
+                    WHERE project_carbon_tax_zone_scenario_id = ?
         );
-        """.format(
+        """,
+        (
             subscenarios.PROJECT_OPERATIONAL_CHARS_SCENARIO_ID,
             subscenarios.FUEL_SCENARIO_ID,
             subscenarios.PROJECT_PORTFOLIO_SCENARIO_ID,
             subscenarios.TEMPORAL_SCENARIO_ID,
             subscenarios.PROJECT_CARBON_TAX_ALLOWANCE_SCENARIO_ID,
             subscenarios.PROJECT_CARBON_TAX_ZONE_SCENARIO_ID,
-        )
+        ),
     )
 
     return project_zones, project_carbon_tax_allowance
@@ -512,23 +523,21 @@ def write_model_inputs(
 
     # projects.tab
     # Make a dict for easy access
-    prj_zone_dict = dict()
-    for prj, zone in project_zones:
-        prj_zone_dict[str(prj)] = "." if zone is None else str(zone)
+    prj_zone_dict = {
+        str(prj): "." if zone is None else str(zone) for prj, zone in project_zones
+    }
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "r",
-    ) as projects_file_in:
+    projects_file = os.path.join(
+        scenario_directory,
+        weather_iteration,
+        hydro_iteration,
+        availability_iteration,
+        subproblem,
+        stage,
+        "inputs",
+        "projects.tab",
+    )
+    with open(projects_file, "r") as projects_file_in:
         reader = csv.reader(projects_file_in, delimiter="\t", lineterminator="\n")
 
         new_rows = list()
@@ -538,49 +547,45 @@ def write_model_inputs(
         header.append("carbon_tax_zone")
         new_rows.append(header)
 
-        # Append correct values
+        # Append the zone if project specified, otherwise specify no zone
         for row in reader:
-            # If project specified, check if BA specified or not
-            if row[0] in list(prj_zone_dict.keys()):
-                row.append(prj_zone_dict[row[0]])
-                new_rows.append(row)
-            # If project not specified, specify no BA
-            else:
-                row.append(".")
-                new_rows.append(row)
+            row.append(prj_zone_dict.get(row[0], "."))
+            new_rows.append(row)
 
-    with open(
-        os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "projects.tab",
-        ),
-        "w",
-        newline="",
-    ) as projects_file_out:
+    with open(projects_file, "w", newline="") as projects_file_out:
         writer = csv.writer(projects_file_out, delimiter="\t", lineterminator="\n")
         writer.writerows(new_rows)
 
     # project_carbon_tax_allowance.tab
-    ct_allowance_df = cursor_to_df(project_carbon_tax_allowance)
-    if not ct_allowance_df.empty:
-        ct_allowance_df = ct_allowance_df.fillna(".")
-        fpath = os.path.join(
-            scenario_directory,
-            weather_iteration,
-            hydro_iteration,
-            availability_iteration,
-            subproblem,
-            stage,
-            "inputs",
-            "project_carbon_tax_allowance.tab",
-        )
-        ct_allowance_df.to_csv(fpath, index=False, sep="\t")
+    # Only write the file if the query returned rows; stream the rows to the
+    # file, replacing NULLs with "."
+    first_row = project_carbon_tax_allowance.fetchone()
+    if first_row is not None:
+        with open(
+            os.path.join(
+                scenario_directory,
+                weather_iteration,
+                hydro_iteration,
+                availability_iteration,
+                subproblem,
+                stage,
+                "inputs",
+                "project_carbon_tax_allowance.tab",
+            ),
+            "w",
+            newline="",
+        ) as ct_allowance_tab_file:
+            writer = csv.writer(
+                ct_allowance_tab_file, delimiter="\t", lineterminator="\n"
+            )
+
+            # Write header
+            writer.writerow([s[0] for s in project_carbon_tax_allowance.description])
+
+            writer.writerows(
+                ["." if i is None else i for i in row]
+                for row in itertools.chain([first_row], project_carbon_tax_allowance)
+            )
 
 
 def process_results(db, c, scenario_id, subscenarios, quiet):
@@ -661,23 +666,39 @@ def export_results(
                 "carbon_tax_allowance_tons",
             ]
         )
-        for p, fg, tmp in m.CARBON_TAX_PRJ_FUEL_GROUP_OPR_TMPS:
-            writer.writerow(
-                [
-                    p,
-                    fg,
-                    tmp,
-                    m.period[tmp],
-                    m.horizon[tmp, m.balancing_type_project[p]],
-                    m.tmp_weight[tmp],
-                    m.hrs_in_tmp[tmp],
-                    m.carbon_tax_zone[p],
-                    m.carbon_tax_allowance[p, fg, m.period[tmp]],
-                    m.carbon_tax_allowance_average_heat_rate[p, m.period[tmp]],
-                    value(m.Opr_Fuel_Burn_by_Fuel_Group_MMBtu[p, fg, tmp]),
-                    value(m.Project_Carbon_Tax_Allowance[p, fg, tmp]),
-                ]
+        # Bind the model components to locals to avoid repeated attribute
+        # lookups for each row
+        period = m.period
+        horizon = m.horizon
+        balancing_type_project = m.balancing_type_project
+        tmp_weight = m.tmp_weight
+        hrs_in_tmp = m.hrs_in_tmp
+        carbon_tax_zone = m.carbon_tax_zone
+        carbon_tax_allowance = m.carbon_tax_allowance
+        average_heat_rate = m.carbon_tax_allowance_average_heat_rate
+        fuel_burn = m.Opr_Fuel_Burn_by_Fuel_Group_MMBtu
+
+        writer.writerows(
+            (
+                p,
+                fg,
+                tmp,
+                period[tmp],
+                horizon[tmp, balancing_type_project[p]],
+                tmp_weight[tmp],
+                hrs_in_tmp[tmp],
+                carbon_tax_zone[p],
+                carbon_tax_allowance[p, fg, period[tmp]],
+                average_heat_rate[p, period[tmp]],
+                value(fuel_burn[p, fg, tmp]),
+                value(allowance_expression),
+            )
+            # The expression is indexed by CARBON_TAX_PRJ_FUEL_GROUP_OPR_TMPS,
+            # so iterate over its items to avoid looking up each index again
+            for (p, fg, tmp), allowance_expression in (
+                m.Project_Carbon_Tax_Allowance.items()
             )
+        )
 
 
 def import_results_into_database(
@@ -750,9 +771,8 @@ def validate_inputs(
         conn,
     )
 
-    # Convert input data into pandas DataFrame
-    df = cursor_to_df(project_zones)
-    zones_w_project = df["carbon_tax_zone"].unique()
+    # Get the carbon tax zones that have projects assigned to them
+    zones_w_project = {zone for (prj, zone) in project_zones}
 
     # Get the required carbon tax zones
     # TODO: make this into a function similar to get_projects()?
@@ -760,12 +780,11 @@ def validate_inputs(
     c = conn.cursor()
     zones = c.execute(
         """SELECT carbon_tax_zone FROM inputs_geography_carbon_tax_zones
-        WHERE carbon_tax_zone_scenario_id = {}
-        """.format(
-            subscenarios.CARBON_TAX_ZONE_SCENARIO_ID
-        )
+        WHERE carbon_tax_zone_scenario_id = ?
+        """,
+        (subscenarios.CARBON_TAX_ZONE_SCENARIO_ID,),
     )
-    zones = [z[0] for z in zones]  # convert to list
+    zones = {z[0] for z in zones}  # convert to set
 
     # Check that each carbon tax zone has at least one project assigned to it
     write_validation_to_database(
@@ -21,6 +21,7 @@ used to limit total transfers on each link.
 
 """
 
+from collections import defaultdict
 import csv
 import os.path
 import pandas as pd
@@ -34,7 +35,7 @@ from pyomo.environ import (
     value,
 )
 
-from db.common_functions import spin_on_database_lock, spin_on_database_lock_generic
+from db.common_functions import spin_on_database_lock
 from gridpath.auxiliary.db_interface import (
     setup_results_import,
     directories_to_db_values,
@@ -172,24 +173,26 @@ def add_model_components(
         rule=max_transfer_constraint_rule,
     )
 
+    # Lines connecting each pair of PRM zones, so that the transmission limits
+    # don't have to scan all operational lines for each transfer link
+    # Loaded in load_model_data, where the lines are grouped by zone pair in a
+    # single pass
+    m.PRM_TX_ZONE_PAIRS = Set(dimen=2, within=m.PRM_ZONES * m.PRM_ZONES)
+
+    m.PRM_TX_LINES_BY_PRM_ZONE_PAIR = Set(m.PRM_TX_ZONE_PAIRS, within=m.PRM_TX_LINES)
+
     # Constrain based on the available transmission
     def transfer_tx_limits_constraint_rule(mod, prm_z_from, prm_z_to, prd):
         # Sum of max capacity of lines with prm_zone_to == z plus
         # Negative sum of min capacity of lines with prm_zone_from == z
         return mod.Transfer_Capacity_Contribution[prm_z_from, prm_z_to, prd] <= sum(
-            mod.Tx_Max_Capacity_MW[tx, op]
-            for (tx, op) in mod.TX_OPR_PRDS
-            if op == prd
-            and tx in mod.PRM_TX_LINES
-            and mod.prm_zone_from[tx] == prm_z_from
-            and mod.prm_zone_to[tx] == prm_z_to
+            mod.Tx_Max_Capacity_MW[tx, prd]
+            for tx in prm_tx_lines_by_zone_pair(mod, prm_z_from, prm_z_to)
+            if (tx, prd) in mod.TX_OPR_PRDS
         ) + -sum(
-            mod.Tx_Min_Capacity_MW[tx, op]
-            for (tx, op) in mod.TX_OPR_PRDS
-            if op == prd
-            and tx in mod.PRM_TX_LINES
-            and mod.prm_zone_from[tx] == prm_z_to
-            and mod.prm_zone_to[tx] == prm_z_from
+            mod.Tx_Min_Capacity_MW[tx, prd]
+            for tx in prm_tx_lines_by_zone_pair(mod, prm_z_to, prm_z_from)
+            if (tx, prd) in mod.TX_OPR_PRDS
         )
 
     m.Capacity_Transfer_Tx_Limits_Constraint = Constraint(
@@ -198,6 +201,13 @@ def add_model_components(
         rule=transfer_tx_limits_constraint_rule,
     )
 
+    # Zones each PRM zone transfers capacity to and receives capacity from, so
+    # that the per-zone sums don't scan all transfer links in every period;
+    # these are loaded in load_model_data (zones without links get empty sets)
+    m.PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE = Set(m.PRM_ZONES, within=m.PRM_ZONES)
+
+    m.PRM_TRANSFER_FROM_ZONES_BY_PRM_ZONE = Set(m.PRM_ZONES, within=m.PRM_ZONES)
+
     # Constrain to simple capacity contributions only (no contribution from ELCC
     # surface)
     m.PRM_FROM_ZONES = Set(
@@ -210,9 +220,8 @@ def add_model_components(
     def transfer_simple_capacity_only_rule(mod, prm_z, prd):
         return (
             sum(
-                mod.Transfer_Capacity_Contribution[prm_z_from, prm_z_to, prd]
-                for (prm_z_from, prm_z_to) in mod.PRM_ZONES_CAPACITY_TRANSFER_ZONES
-                if prm_z_from == prm_z
+                mod.Transfer_Capacity_Contribution[prm_z, prm_z_to, prd]
+                for prm_z_to in mod.PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE[prm_z]
             )
             <= mod.Total_PRM_Simple_Contribution_MW[prm_z, prd]
         )
@@ -226,8 +235,7 @@ def add_model_components(
     def total_transfers_from_init(mod, z, prd):
         return -sum(
             mod.Transfer_Capacity_Contribution[z, t_z, prd]
-            for (zone, t_z) in mod.PRM_ZONES_CAPACITY_TRANSFER_ZONES
-            if zone == z
+            for t_z in mod.PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE[z]
         )
 
     m.Total_Transfers_from_PRM_Zone = Expression(
@@ -237,8 +245,7 @@ def add_model_components(
     def total_transfers_to_init(mod, t_z, prd):
         return sum(
             mod.Transfer_Capacity_Contribution[z, t_z, prd]
-            for (z, to_zone) in mod.PRM_ZONES_CAPACITY_TRANSFER_ZONES
-            if to_zone == t_z
+            for z in mod.PRM_TRANSFER_FROM_ZONES_BY_PRM_ZONE[t_z]
         )
 
     m.Total_Transfers_to_PRM_Zone = Expression(
@@ -264,6 +271,21 @@ def add_model_components(
     )
 
 
+# Set Rules
+###############################################################################
+
+
+def prm_tx_lines_by_zone_pair(mod, prm_z_from, prm_z_to):
+    """
+    Get the PRM transmission lines going from prm_z_from to prm_z_to (an
+    empty list if there are none).
+    """
+    if (prm_z_from, prm_z_to) in mod.PRM_TX_ZONE_PAIRS:
+        return mod.PRM_TX_LINES_BY_PRM_ZONE_PAIR[prm_z_from, prm_z_to]
+    else:
+        return []
+
+
 # Input-Output
 ###############################################################################
 
@@ -289,6 +311,40 @@ def load_model_data(
     :param stage:
     :return:
     """
+    # Index the capacity transfer links (loaded in
+    # transmission.reliability.capacity_transfer_links) by zone in one pass
+    transfer_links_tab_file = os.path.join(
+        scenario_directory,
+        weather_iteration,
+        hydro_iteration,
+        availability_iteration,
+        subproblem,
+        stage,
+        "inputs",
+        "prm_capacity_transfer_zone_links.tab",
+    )
+    if os.path.exists(transfer_links_tab_file):
+        # The first two columns are the link's zones (the header of the
+        # second column differs between the written and test inputs)
+        df = pd.read_csv(
+            transfer_links_tab_file,
+            sep="\t",
+            usecols=[0, 1],
+            keep_default_na=False,
+            na_values=["."],
+        )
+        transfer_to_zones_by_zone = defaultdict(list)
+        transfer_from_zones_by_zone = defaultdict(list)
+        for prm_z_from, prm_z_to in df.itertuples(index=False):
+            transfer_to_zones_by_zone[prm_z_from].append(prm_z_to)
+            transfer_from_zones_by_zone[prm_z_to].append(prm_z_from)
+        data_portal.data()["PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE"] = dict(
+            transfer_to_zones_by_zone
+        )
+        data_portal.data()["PRM_TRANSFER_FROM_ZONES_BY_PRM_ZONE"] = dict(
+            transfer_from_zones_by_zone
+        )
+
     # TODO: select only relevant columns once costs are added to this file
     #  and rename file
     limits_tab_file = os.path.join(
@@ -302,14 +358,31 @@ def load_model_data(
         "prm_capacity_transfer_params.tab",
     )
     if os.path.exists(limits_tab_file):
-        data_portal.load(
-            filename=limits_tab_file,
-            param=(
-                m.min_transfer_powerunit,
-                m.max_transfer_powerunit,
-                m.capacity_transfer_cost_per_powerunit_yr,
-            ),
+        # Parse the file with pandas rather than Pyomo's tab reader and pass
+        # the param data to the data portal directly; "." values are skipped
+        # so that the params get their default values
+        df = pd.read_csv(
+            limits_tab_file,
+            sep="\t",
+            keep_default_na=False,
+            na_values=["."],
         )
+        for param in [
+            "min_transfer_powerunit",
+            "max_transfer_powerunit",
+            "capacity_transfer_cost_per_powerunit_yr",
+        ]:
+            param_df = df[df[param].notna()]
+            data_portal.data()[param] = dict(
+                zip(
+                    zip(
+                        param_df["prm_zone"],
+                        param_df["prm_capacity_transfer_zone"],
+                        param_df["period"],
+                    ),
+                    param_df[param],
+                )
+            )
 
     prm_transmission_lines_tab_file = os.path.join(
         scenario_directory,
@@ -322,13 +395,31 @@ def load_model_data(
         "prm_transmission_lines.tab",
     )
     if os.path.exists(prm_transmission_lines_tab_file):
-        data_portal.load(
-            filename=prm_transmission_lines_tab_file,
-            index=m.PRM_TX_LINES,
-            param=(
-                m.prm_zone_from,
-                m.prm_zone_to,
-            ),
+        df = pd.read_csv(
+            prm_transmission_lines_tab_file,
+            sep="\t",
+            keep_default_na=False,
+            na_values=["."],
+        )
+        data_portal.data()["PRM_TX_LINES"] = {None: df["transmission_line"].tolist()}
+        data_portal.data()["prm_zone_from"] = dict(
+            zip(df["transmission_line"], df["prm_zone_from"])
+        )
+        data_portal.data()["prm_zone_to"] = dict(
+            zip(df["transmission_line"], df["prm_zone_to"])
+        )
+
+        # Group the lines by (prm_zone_from, prm_zone_to)
+        prm_tx_lines_by_zone_pair = defaultdict(list)
+        for tx, prm_z_from, prm_z_to in zip(
+            df["transmission_line"], df["prm_zone_from"], df["prm_zone_to"]
+        ):
+            prm_tx_lines_by_zone_pair[prm_z_from, prm_z_to].append(tx)
+        data_portal.data()["PRM_TX_ZONE_PAIRS"] = {
+            None: sorted(prm_tx_lines_by_zone_pair.keys())
+        }
+        data_portal.data()["PRM_TX_LINES_BY_PRM_ZONE_PAIR"] = dict(
+            prm_tx_lines_by_zone_pair
         )
 
 
@@ -356,44 +447,52 @@ def get_inputs_from_database(
 
     c1 = conn.cursor()
     limits = c1.execute(
-        f"""
-        SELECT prm_zone, prm_capacity_transfer_zone, period, 
-        min_transfer_powerunit, max_transfer_powerunit, capacity_transfer_cost_per_powerunit_yr
+        """
+        SELECT prm_zone, prm_capacity_transfer_zone, period,
+        COALESCE(min_transfer_powerunit, '.'), COALESCE(max_transfer_powerunit, '.'),
+        COALESCE(capacity_transfer_cost_per_powerunit_yr, '.')
         FROM inputs_transmission_prm_capacity_transfer_params
         JOIN
         (SELECT prm_zone, prm_capacity_transfer_zone
         FROM inputs_transmission_prm_capacity_transfers
-        WHERE prm_capacity_transfer_scenario_id = {subscenarios.PRM_CAPACITY_TRANSFER_SCENARIO_ID}) as relevant_zones
+        WHERE prm_capacity_transfer_scenario_id = ?) as relevant_zones
         using (prm_zone, prm_capacity_transfer_zone)
-        WHERE prm_capacity_transfer_params_scenario_id = 
-        {subscenarios.PRM_CAPACITY_TRANSFER_PARAMS_SCENARIO_ID}
+        WHERE prm_capacity_transfer_params_scenario_id = ?
         AND prm_zone IN
         (SELECT prm_zone FROM inputs_geography_prm_zones
-        WHERE prm_zone_scenario_id = {subscenarios.PRM_ZONE_SCENARIO_ID})
+        WHERE prm_zone_scenario_id = ?)
         AND prm_capacity_transfer_zone IN
         (SELECT prm_zone FROM inputs_geography_prm_zones
-        WHERE prm_zone_scenario_id = {subscenarios.PRM_ZONE_SCENARIO_ID});
-        """
+        WHERE prm_zone_scenario_id = ?);
+        """,
+        (
+            subscenarios.PRM_CAPACITY_TRANSFER_SCENARIO_ID,
+            subscenarios.PRM_CAPACITY_TRANSFER_PARAMS_SCENARIO_ID,
+            subscenarios.PRM_ZONE_SCENARIO_ID,
+            subscenarios.PRM_ZONE_SCENARIO_ID,
+        ),
     )
 
     c2 = conn.cursor()
     transmission_lines = c2.execute(
         """SELECT transmission_line, prm_zone_from, prm_zone_to
             FROM inputs_transmission_prm_zones
-            WHERE transmission_prm_zone_scenario_id = {prm_z}
+            WHERE transmission_prm_zone_scenario_id = ?
         AND transmission_line IN
         (SELECT transmission_line FROM inputs_transmission_portfolios
-        WHERE transmission_portfolio_scenario_id = {portfolio})
+        WHERE transmission_portfolio_scenario_id = ?)
         AND prm_zone_from IN
         (SELECT prm_zone FROM inputs_geography_prm_zones
-        WHERE prm_zone_scenario_id = {prm_zone})
+        WHERE prm_zone_scenario_id = ?)
         AND prm_zone_to IN
         (SELECT prm_zone FROM inputs_geography_prm_zones
-        WHERE prm_zone_scenario_id = {prm_zone});""".format(
-            prm_z=subscenarios.TRANSMISSION_PRM_ZONE_SCENARIO_ID,
-            portfolio=subscenarios.TRANSMISSION_PORTFOLIO_SCENARIO_ID,
-            prm_zone=subscenarios.PRM_ZONE_SCENARIO_ID,
-        )
+        WHERE prm_zone_scenario_id = ?);""",
+        (
+            subscenarios.TRANSMISSION_PRM_ZONE_SCENARIO_ID,
+            subscenarios.TRANSMISSION_PORTFOLIO_SCENARIO_ID,
+            subscenarios.PRM_ZONE_SCENARIO_ID,
+            subscenarios.PRM_ZONE_SCENARIO_ID,
+        ),
     )
 
     # TODO: allow Tx lines with no PRM zones from and to specified, that are only
@@ -448,8 +547,10 @@ def write_model_inputs(
         conn,
     )
 
-    limits = limits.fetchall()
-    if limits:
+    # Peek at the first row rather than fetching all rows to check whether
+    # there is anything to write
+    first_row = limits.fetchone()
+    if first_row is not None:
         with open(
             os.path.join(
                 scenario_directory,
@@ -478,12 +579,12 @@ def write_model_inputs(
                 ]
             )
 
-            for row in limits:
-                replace_nulls = ["." if i is None else i for i in row]
-                writer.writerow(replace_nulls)
+            # NULLs are already replaced with "." in the query
+            writer.writerow(first_row)
+            writer.writerows(limits)
 
-    transmission_lines = transmission_lines.fetchall()
-    if transmission_lines:
+    first_row = transmission_lines.fetchone()
+    if first_row is not None:
         with open(
             os.path.join(
                 scenario_directory,
@@ -511,9 +612,9 @@ def write_model_inputs(
                 ]
             )
 
-            for row in transmission_lines:
-                replace_nulls = ["." if i is None else i for i in row]
-                writer.writerow(replace_nulls)
+            # The zone columns can't be NULL given the IN filters in the query
+            writer.writerow(first_row)
+            writer.writerows(transmission_lines)
 
 
 def export_results(
@@ -622,7 +723,7 @@ def import_results_into_database(
     setup_results_import(
         conn=db,
         cursor=c,
-        table="results_system_costs",
+        table="results_system_capacity_transfers",
         scenario_id=scenario_id,
         weather_iteration=weather_iteration,
         hydro_iteration=hydro_iteration,
@@ -631,18 +732,51 @@ def import_results_into_database(
         stage=stage,
     )
 
-    df = pd.read_csv(
-        os.path.join(results_directory, "capacity_contribution_transfers.csv")
-    )
-    df["scenario_id"] = scenario_id
-    df["subproblem_id"] = subproblem
-    df["stage_id"] = stage
-
-    spin_on_database_lock_generic(
-        command=df.to_sql(
-            name="results_system_capacity_transfers",
-            con=db,
-            if_exists="append",
-            index=False,
-        )
+    (
+        db_weather_iteration,
+        db_hydro_iteration,
+        db_availability_iteration,
+        db_subproblem,
+        db_stage,
+    ) = directories_to_db_values(
+        weather_iteration, hydro_iteration, availability_iteration, subproblem, stage
     )
+
+    with open(
+        os.path.join(results_directory, "capacity_contribution_transfers.csv"),
+        "r",
+    ) as f:
+        reader = csv.reader(f)
+        next(reader)  # skip header
+        results = [
+            (
+                scenario_id,
+                db_weather_iteration,
+                db_hydro_iteration,
+                db_availability_iteration,
+                db_subproblem,
+                db_stage,
+                prm_zone_from,
+                prm_zone_to,
+                period,
+                capacity_transfer_mw,
+                capacity_transfer_cost_per_yr_in_period,
+            )
+            for (
+                prm_zone_from,
+                prm_zone_to,
+                period,
+                capacity_transfer_mw,
+                capacity_transfer_cost_per_yr_in_period,
+            ) in reader
+        ]
+
+    # Insert all rows with a single executemany (and a single commit)
+    insert_sql = """
+        INSERT INTO results_system_capacity_transfers
+        (scenario_id, weather_iteration, hydro_iteration, availability_iteration,
+        subproblem_id, stage_id, prm_zone_from, prm_zone_to, period,
+        capacity_transfer_mw, capacity_transfer_cost_per_yr_in_period)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+        """
+    spin_on_database_lock(conn=db, cursor=c, sql=insert_sql, data=results)
@@ -17,7 +17,9 @@ Flows across water links.
 """
 
 import csv
+import numpy as np
 import os.path
+import pandas as pd
 
 from pyomo.environ import (
     Set,
@@ -33,8 +35,6 @@ from pyomo.environ import (
 from gridpath.auxiliary.db_interface import directories_to_db_values, import_csv
 from gridpath.common_functions import create_results_df
 from gridpath.project.common_functions import (
-    check_if_boundary_type_and_last_timepoint,
-    check_boundary_type,
     check_if_boundary_type_and_first_timepoint,
 )
 
@@ -66,18 +66,30 @@ def add_model_components(
 
     # Set WATER_LINK_DEPARTURE_ARRIVAL_TMPS
     def water_link_departure_arrival_tmp_init(mod):
-        wl_dep_arr_tmp = []
+        # The arrival timepoint depends only on the departure timepoint and the
+        # travel time, so only determine the departure-arrival timepoint pairs
+        # once for links with the same travel time
+        dep_arr_tmps = {}
+        # Bind the model components we need to locals outside the loops
+        transport_time_hours = mod.water_link_flow_transport_time_hours
+        tmps = list(mod.TMPS)
         for wl in mod.WATER_LINKS:
-            for departure_tmp in mod.TMPS:
-                arrival_tmp = determine_arrival_timepoint(
-                    mod=mod,
-                    dep_tmp=departure_tmp,
-                    travel_time_hours=mod.water_link_flow_transport_time_hours[wl],
+            travel_time_hours = transport_time_hours[wl]
+            if travel_time_hours not in dep_arr_tmps:
+                arrival_tmps = determine_arrival_timepoints(
+                    mod=mod, travel_time_hours=travel_time_hours
                 )
-                if arrival_tmp is not None:
-                    wl_dep_arr_tmp.append((wl, departure_tmp, arrival_tmp))
+                dep_arr_tmps[travel_time_hours] = [
+                    (dep_tmp, arrival_tmps[dep_tmp])
+                    for dep_tmp in tmps
+                    if arrival_tmps[dep_tmp] is not None
+                ]
 
-        return wl_dep_arr_tmp
+        return [
+            (wl, dep_tmp, arr_tmp)
+            for wl in mod.WATER_LINKS
+            for (dep_tmp, arr_tmp) in dep_arr_tmps[transport_time_hours[wl]]
+        ]
 
     m.TMPS_AND_OUTSIDE_HORIZON = Set(initialize=m.TMPS | {"tmp_outside_horizon"})
     m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS = Set(
@@ -86,6 +98,33 @@ def add_model_components(
         initialize=water_link_departure_arrival_tmp_init,
     )
 
+    # Flow bounds that can't be violated are enforced as bounds on the flow
+    # variable (see water_link_flow_rate_bounds); we only need constraints
+    # on links that allow violations, and only where the bounds aren't
+    # trivially met, i.e., with a minimum flow greater than 0 or a maximum
+    # flow less than infinity
+    m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MIN_CONSTRAINT = Set(
+        dimen=3,
+        within=m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS,
+        initialize=lambda mod: [
+            (wl, dep_tmp, arr_tmp)
+            for (wl, dep_tmp, arr_tmp) in mod.WATER_LINK_DEPARTURE_ARRIVAL_TMPS
+            if mod.allow_water_link_min_flow_violation[wl]
+            and mod.min_flow_vol_per_second[wl, dep_tmp] > 0
+        ],
+    )
+
+    m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MAX_CONSTRAINT = Set(
+        dimen=3,
+        within=m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS,
+        initialize=lambda mod: [
+            (wl, dep_tmp, arr_tmp)
+            for (wl, dep_tmp, arr_tmp) in mod.WATER_LINK_DEPARTURE_ARRIVAL_TMPS
+            if mod.allow_water_link_max_flow_violation[wl]
+            and mod.max_flow_vol_per_second[wl, dep_tmp] != float("inf")
+        ],
+    )
+
     def departure_tmp_init(mod):
         dep_tmp_dict = {}
         for water_link, dep_tmp, arr_tmp in mod.WATER_LINK_DEPARTURE_ARRIVAL_TMPS:
@@ -117,7 +156,9 @@ def add_model_components(
 
     # ### Variables ### #
     m.Water_Link_Flow_Rate_Vol_per_Sec = Var(
-        m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS, within=NonNegativeReals
+        m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS,
+        within=NonNegativeReals,
+        bounds=water_link_flow_rate_bounds,
     )
 
     m.Water_Link_Min_Flow_Violation = Var(
@@ -172,7 +213,7 @@ def add_model_components(
         )
 
     m.Water_Link_Minimum_Flow_Constraint = Constraint(
-        m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS, rule=min_flow_rule
+        m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MIN_CONSTRAINT, rule=min_flow_rule
     )
 
     def max_flow_rule(mod, wl, dep_tmp, arr_tmp):
@@ -183,93 +224,101 @@ def add_model_components(
         )
 
     m.Water_Link_Maximum_Flow_Constraint = Constraint(
-        m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS, rule=max_flow_rule
+        m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MAX_CONSTRAINT, rule=max_flow_rule
     )
 
 
-def determine_arrival_timepoint(mod, dep_tmp, travel_time_hours):
+def water_link_flow_rate_bounds(mod, wl, dep_tmp, arr_tmp):
+    """
+    Enforce the min and max flows as bounds on the flow variable unless
+    violations of the min or max flow are allowed on the link, in which case
+    they are enforced via the Water_Link_Minimum_Flow_Constraint and
+    Water_Link_Maximum_Flow_Constraint respectively.
+    """
+    if mod.allow_water_link_min_flow_violation[wl]:
+        lower_bound = 0
+    else:
+        lower_bound = mod.min_flow_vol_per_second[wl, dep_tmp]
+
+    max_flow = mod.max_flow_vol_per_second[wl, dep_tmp]
+    if mod.allow_water_link_max_flow_violation[wl] or max_flow == float("inf"):
+        upper_bound = None
+    else:
+        upper_bound = max_flow
+
+    return lower_bound, upper_bound
+
+
+def determine_arrival_timepoints(mod, travel_time_hours):
     """
+    Determine the arrival timepoint of flows departing in each timepoint given
+    the travel time. Returns a dictionary of arrival timepoints by departure
+    timepoint.
+
+    Rather than walking the next timepoints from each departure timepoint,
+    we get the cumulative hours from the start of each horizon and find the
+    first timepoint by which the travel time has elapsed with a binary search.
+    If the travel time is less than the hours in the departure timepoint,
+    balancing happens within the departure timepoint. If the travel time
+    hasn't elapsed by the end of a 'linear' horizon, the arrival timepoint is
+    'tmp_outside_horizon'; in a 'circular' horizon, we loop back to the
+    start of the horizon until we reach the departure timepoint again.
+
     USER WARNING: timepoint durations longer than the travel time may create
     issues. You could also see issues if timepoints don't receive any flows
     because of short durations. This functionality is new and not yet
     extensively tested, so proceed with caution.
     """
-    # If travel time is less than the hours in the departure timepoint,
-    # balancing happens within the departure timepoint
-    if travel_time_hours < mod.hrs_in_tmp[dep_tmp]:
-        arr_tmp = dep_tmp
-    # If this is the last timepoint of a linear horizon, there are no
-    # timepoints to check and we'll return 'tmp_outside_horizon'
-    elif check_if_boundary_type_and_last_timepoint(
-        mod=mod,
-        tmp=dep_tmp,
-        balancing_type=mod.water_system_balancing_type,
-        boundary_type="linear",
-    ):
-        arr_tmp = "tmp_outside_horizon"
-    elif check_if_boundary_type_and_last_timepoint(
-        mod=mod,
-        tmp=dep_tmp,
-        balancing_type=mod.water_system_balancing_type,
-        boundary_type="linked",
-    ):
-        # TODO: add linked
-        arr_tmp = None
-    else:
-        # Otherwise, we check the following timepoints
-        # First we'll check the next timepoint of the starting timepoint and
-        # start with the duration of the starting timepoint
-        arr_tmp = mod.next_tmp[dep_tmp, mod.water_system_balancing_type]
-        hours_from_departure_tmp = mod.hrs_in_tmp[dep_tmp]
-        while hours_from_departure_tmp < travel_time_hours:
-            # If we haven't exceeded the travel time yet, we move on to the next tmp
-            # In a 'linear' horizon setting, once we reach the last
-            # timepoint of the horizon, we set the arrival timepoint to
-            # "tmp_outside_horizon" and break out of the loop
-            if check_if_boundary_type_and_last_timepoint(
-                mod=mod,
-                tmp=arr_tmp,
-                balancing_type=mod.water_system_balancing_type,
-                boundary_type="linear",
-            ):
-                arr_tmp = "tmp_outside_horizon"
-                break
+    bt = mod.water_system_balancing_type
+    hrs_in_tmp = mod.hrs_in_tmp
+
+    arr_tmps = {}
+    for hrz in mod.HRZS_BY_BLN_TYPE[bt]:
+        tmps = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])
+        n_tmps = len(tmps)
+        boundary = mod.boundary[bt, hrz]
+        hrs = np.array([hrs_in_tmp[tmp] for tmp in tmps], dtype=float)
+
+        # In a 'circular' horizon, we can loop back to the first timepoint of
+        # the horizon, so we lay out the horizon timepoints twice
+        if boundary == "circular":
+            hrs = np.tile(hrs, 2)
+        # Hours from the start of the horizon to the start of each timepoint
+        start_hrs = np.concatenate(([0.0], np.cumsum(hrs)))
+        # The arrival timepoint is the first timepoint after the departure
+        # timepoint that starts at least travel_time_hours after the departure
+        # timepoint starts
+        arr_idx = np.maximum(
+            np.searchsorted(
+                start_hrs, start_hrs[:n_tmps] + travel_time_hours, side="left"
+            ),
+            np.arange(1, n_tmps + 1),
+        )
+
+        for dep_idx, dep_tmp in enumerate(tmps):
+            if travel_time_hours < hrs[dep_idx]:
+                arr_tmps[dep_tmp] = dep_tmp
             # In a 'circular' horizon setting, once we loop back to the
-            # departure timepoint again, we break out of the loop since there
-            # are no more timepoints to consider (we have already checked all
-            # horizon timepoints)
-            elif (
-                check_boundary_type(
-                    mod=mod,
-                    tmp=dep_tmp,
-                    balancing_type=mod.water_system_balancing_type,
-                    boundary_type="circular",
-                )
-                and arr_tmp == dep_tmp
-            ):
-                arr_tmp = "tmp_outside_horizon"
-                break
+            # departure timepoint again, there are no more timepoints to
+            # consider (we have already checked all horizon timepoints)
+            elif boundary == "circular":
+                if arr_idx[dep_idx] <= dep_idx + n_tmps:
+                    arr_tmps[dep_tmp] = tmps[arr_idx[dep_idx] % n_tmps]
+                else:
+                    arr_tmps[dep_tmp] = "tmp_outside_horizon"
+            elif arr_idx[dep_idx] < n_tmps:
+                arr_tmps[dep_tmp] = tmps[arr_idx[dep_idx]]
+            # In a 'linear' horizon setting, once we reach the last timepoint
+            # of the horizon, the arrival timepoint is "tmp_outside_horizon"
+            elif boundary == "linear":
+                arr_tmps[dep_tmp] = "tmp_outside_horizon"
             # TODO: only allow the first horizon of a subproblem to have
             #  linked timepoints
-            # In a 'linked' horizon setting, once we reach the first
-            # timepoint of the horizon, we'll start adding the linked
-            # timepoints until we reach the target min time
-            elif check_if_boundary_type_and_last_timepoint(
-                mod=mod,
-                tmp=arr_tmp,
-                balancing_type=mod.water_system_balancing_type,
-                boundary_type="linked",
-            ):
-                # TODO: add linked
-                arr_tmp = None
-                break
-            # Otherwise, we move on to the next timepoint and will add that
-            # timepoint's duration to hours_from_departure_tmp
+            # TODO: add linked
             else:
-                hours_from_departure_tmp += mod.hrs_in_tmp[arr_tmp]
-                arr_tmp = mod.next_tmp[arr_tmp, mod.water_system_balancing_type]
+                arr_tmps[dep_tmp] = None
 
-    return arr_tmp
+    return arr_tmps
 
 
 def load_model_data(
@@ -294,10 +343,23 @@ def load_model_data(
         "water_flow_bounds.tab",
     )
     if os.path.exists(fname):
-        data_portal.load(
-            filename=fname,
-            param=(m.min_flow_vol_per_second, m.max_flow_vol_per_second),
+        # Parse the bounds file with pandas rather than Pyomo's tab reader and
+        # pass the param data to the data portal directly; "." values are
+        # skipped so that the params get their default values
+        df = pd.read_csv(
+            fname,
+            sep="\t",
+            keep_default_na=False,
+            na_values=["."],
         )
+        for param in ["min_flow_vol_per_second", "max_flow_vol_per_second"]:
+            param_df = df[df[param].notna()]
+            data_portal.data()[param] = dict(
+                zip(
+                    zip(param_df["water_link"], param_df["timepoint"]),
+                    param_df[param],
+                )
+            )
 
 
 def get_inputs_from_database(
@@ -320,26 +382,33 @@ def get_inputs_from_database(
 
     c = conn.cursor()
     water_flows = c.execute(
-        f"""SELECT water_link, timepoint, 
-            min_flow_vol_per_second, max_flow_vol_per_second
+        """SELECT water_link, timepoint,
+            COALESCE(min_flow_vol_per_second, '.'),
+            COALESCE(max_flow_vol_per_second, '.')
             FROM inputs_system_water_flows
-            WHERE water_flow_scenario_id = 
-            {subscenarios.WATER_FLOW_SCENARIO_ID}
+            WHERE water_flow_scenario_id = ?
             AND water_link IN (
                 SELECT water_link
                 FROM inputs_geography_water_network
-                WHERE water_network_scenario_id = 
-                {subscenarios.WATER_NETWORK_SCENARIO_ID}
+                WHERE water_network_scenario_id = ?
             )
             AND timepoint
             IN (SELECT timepoint
                 FROM inputs_temporal
-                WHERE temporal_scenario_id = {subscenarios.TEMPORAL_SCENARIO_ID}
-                AND subproblem_id = {subproblem}
-                AND stage_id = {stage})
-            AND hydro_iteration = {hydro_iteration}
+                WHERE temporal_scenario_id = ?
+                AND subproblem_id = ?
+                AND stage_id = ?)
+            AND hydro_iteration = ?
             ;
-            """
+            """,
+        (
+            subscenarios.WATER_FLOW_SCENARIO_ID,
+            subscenarios.WATER_NETWORK_SCENARIO_ID,
+            subscenarios.TEMPORAL_SCENARIO_ID,
+            subproblem,
+            stage,
+            hydro_iteration,
+        ),
     )
 
     return water_flows
@@ -412,8 +481,10 @@ def write_model_inputs(
         conn,
     )
 
-    water_flow_bounds_list = [row for row in water_flows]
-    if water_flow_bounds_list:
+    # Peek at the first row rather than fetching all rows to check whether
+    # there is anything to write
+    first_row = water_flows.fetchone()
+    if first_row is not None:
         with open(
             os.path.join(
                 scenario_directory,
@@ -440,9 +511,9 @@ def write_model_inputs(
                 ]
             )
 
-            for row in water_flow_bounds_list:
-                replace_nulls = ["." if i is None else i for i in row]
-                writer.writerow(replace_nulls)
+            # NULLs are already replaced with "." in the query
+            writer.writerow(first_row)
+            writer.writerows(water_flows)
 
 
 def export_results(
@@ -469,16 +540,21 @@ def export_results(
         "water_flow_min_violation_vol_per_sec",
         "water_flow_max_violation_vol_per_sec",
     ]
+    # Read the flow variable values directly from the variable data rather
+    # than through value()
+    flow_rates = m.Water_Link_Flow_Rate_Vol_per_Sec
+    min_flow_violation = m.Water_Link_Min_Flow_Violation_Expression
+    max_flow_violation = m.Water_Link_Max_Flow_Violation_Expression
     data = [
         [
             wl,
             dep_tmp,
             arr_tmp,
-            value(m.Water_Link_Flow_Rate_Vol_per_Sec[wl, dep_tmp, arr_tmp]),
-            value(m.Water_Link_Min_Flow_Violation_Expression[wl, dep_tmp, arr_tmp]),
-            value(m.Water_Link_Max_Flow_Violation_Expression[wl, dep_tmp, arr_tmp]),
+            flow_rate.value,
+            value(min_flow_violation[wl, dep_tmp, arr_tmp]),
+            value(max_flow_violation[wl, dep_tmp, arr_tmp]),
         ]
-        for (wl, dep_tmp, arr_tmp) in m.WATER_LINK_DEPARTURE_ARRIVAL_TMPS
+        for (wl, dep_tmp, arr_tmp), flow_rate in flow_rates.items()
     ]
     results_df = create_results_df(
         index_columns=["water_link", "departure_timepoint", "arrival_timepoint"],
@@ -50,22 +50,29 @@ def add_model_components(
     # horizon spans; if in a single period, simply use the period coefficient
     # WARNING: thread carefully, this is difficult to interpret if periods
     # have a vastly different number of years for example
+    def fraction_of_horizon_in_period_init(mod, bt, h, prd):
+        hrz_tmps_in_prd = [
+            tmp for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h] if mod.period[tmp] == prd
+        ]
+        # Most horizons don't overlap most periods; skip the weighted sum over
+        # the whole horizon for those
+        if not hrz_tmps_in_prd:
+            return 0
+        hrs_in_prd = sum(
+            mod.hrs_in_tmp[tmp] * mod.tmp_weight[tmp] for tmp in hrz_tmps_in_prd
+        )
+        hrs_in_hrz = sum(
+            mod.hrs_in_tmp[tmp] * mod.tmp_weight[tmp]
+            for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
+        )
+        return hrs_in_prd / hrs_in_hrz
+
     m.fraction_of_horizon_in_period = Param(
         m.BLN_TYPE_HRZS,
         m.PERIODS,
         within=PercentFraction,
         default=0,
-        initialize=lambda mod, bt, h, prd: (
-            sum(
-                mod.hrs_in_tmp[tmp] * mod.tmp_weight[tmp]
-                for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
-                if mod.period[tmp] == prd
-            )
-        )
-        / sum(
-            mod.hrs_in_tmp[tmp] * mod.tmp_weight[tmp]
-            for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
-        ),
+        initialize=fraction_of_horizon_in_period_init,
     )
 
     m.hrz_objective_coefficient = Param(
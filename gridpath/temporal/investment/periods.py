@@ -39,6 +39,7 @@ depending on when (in which period) they are incurred.
 
 import csv
 import os.path
+import pandas as pd
 
 from pyomo.environ import Set, Param, PositiveIntegers, NonNegativeReals
 
@@ -216,12 +217,9 @@ def add_model_components(
     # Derived Sets
     ###########################################################################
 
-    m.TMPS_IN_PRD = Set(
-        m.PERIODS,
-        initialize=lambda mod, p: sorted(
-            list(set(tmp for tmp in mod.TMPS if mod.period[tmp] == p)),
-        ),
-    )
+    # Loaded in load_model_data, where the timepoints are bucketed by period
+    # in a single pass
+    m.TMPS_IN_PRD = Set(m.PERIODS, within=m.TMPS)
 
     m.NOT_FIRST_PRDS = Set(
         within=m.PERIODS, initialize=lambda mod: list(mod.PERIODS)[1:]
@@ -271,8 +269,9 @@ def load_model_data(
     stage,
 ):
     """ """
-    data_portal.load(
-        filename=os.path.join(
+    # Read periods.tab once for the set of periods and their params
+    periods_df = pd.read_csv(
+        os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -282,24 +281,27 @@ def load_model_data(
             "inputs",
             "periods.tab",
         ),
-        select=(
-            "period",
-            "discount_factor",
-            "hours_in_period_timepoints",
-            "period_start_year",
-            "period_end_year",
-        ),
-        index=m.PERIODS,
-        param=(
-            m.discount_factor,
-            m.hours_in_period_timepoints,
-            m.period_start_year,
-            m.period_end_year,
-        ),
+        sep="\t",
     )
-
-    data_portal.load(
-        filename=os.path.join(
+    periods = periods_df["period"].tolist()
+
+    data_portal.data()["PERIODS"] = {None: periods}
+    for param in [
+        "discount_factor",
+        "hours_in_period_timepoints",
+        "period_start_year",
+        "period_end_year",
+    ]:
+        data_portal.data()[param] = dict(zip(periods, periods_df[param].tolist()))
+
+    # Get the period of each timepoint and the timepoints in each period in
+    # one pass over the timepoints file rather than filtering all timepoints
+    # for each period
+    # Periods with no timepoints in this subproblem get an empty set
+    tmps_in_prd = {p: list() for p in periods}
+    period_by_tmp = dict()
+    with open(
+        os.path.join(
             scenario_directory,
             weather_iteration,
             hydro_iteration,
@@ -308,11 +310,25 @@ def load_model_data(
             stage,
             "inputs",
             "timepoints.tab",
-        ),
-        select=("timepoint", "period"),
-        index=m.TMPS,
-        param=m.period,
-    )
+        )
+    ) as f:
+        reader = csv.reader(f, delimiter="\t", lineterminator="\n")
+        header = next(reader)
+        tmp_col, prd_col = header.index("timepoint"), header.index("period")
+        for row in reader:
+            tmp, prd = int(row[tmp_col]), int(row[prd_col])
+            if prd not in tmps_in_prd:
+                raise ValueError(
+                    "Period {} of timepoint {} in timepoints.tab is not "
+                    "specified in periods.tab.".format(prd, tmp)
+                )
+            period_by_tmp[tmp] = prd
+            tmps_in_prd[prd].append(tmp)
+
+    data_portal.data()["period"] = period_by_tmp
+    data_portal.data()["TMPS_IN_PRD"] = {
+        p: sorted(tmps) for p, tmps in tmps_in_prd.items()
+    }
 
 
 # Database
@@ -192,16 +192,12 @@ def add_model_components(
     m.TMPS_BLN_TYPES = Set(
         dimen=2,
         within=m.TMPS * m.BLN_TYPES,
+        # Each timepoint is on exactly one horizon of each balancing type, so
+        # the pairs are already unique
         initialize=lambda mod: sorted(
-            list(
-                set(
-                    [
-                        (tmp, bt)
-                        for (bt, h) in mod.BLN_TYPE_HRZS
-                        for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
-                    ]
-                ),
-            )
+            (tmp, bt)
+            for (bt, h) in mod.BLN_TYPE_HRZS
+            for tmp in mod.TMPS_BY_BLN_TYPE_HRZ[bt, h]
         ),
     )
 
@@ -220,13 +216,13 @@ def add_model_components(
     m.first_hrz_tmp = Param(
         m.BLN_TYPE_HRZS,
         within=PositiveIntegers,
-        initialize=lambda mod, b, h: list(mod.TMPS_BY_BLN_TYPE_HRZ[b, h])[0],
+        initialize=lambda mod, b, h: mod.TMPS_BY_BLN_TYPE_HRZ[b, h].first(),
     )
 
     m.last_hrz_tmp = Param(
         m.BLN_TYPE_HRZS,
         within=PositiveIntegers,
-        initialize=lambda mod, b, h: list(mod.TMPS_BY_BLN_TYPE_HRZ[b, h])[-1],
+        initialize=lambda mod, b, h: mod.TMPS_BY_BLN_TYPE_HRZ[b, h].last(),
     )
 
     def hrz_period_init(mod, bt, hrz):
@@ -324,9 +320,7 @@ def prev_tmp_init(mod, tmp, bt):
                 "or 'linked.'"
             )
     else:
-        prev_tmp = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])[
-            list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]).index(tmp) - 1
-        ]
+        prev_tmp = mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz].prev(tmp)
 
     return prev_tmp
 
@@ -359,9 +353,7 @@ def next_tmp_init(mod, tmp, bt):
                 "or 'linked.'"
             )
     else:
-        next_tmp = list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz])[
-            list(mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz]).index(tmp) + 1
-        ]
+        next_tmp = mod.TMPS_BY_BLN_TYPE_HRZ[bt, hrz].next(tmp)
 
     return next_tmp
 
@@ -145,14 +145,14 @@ def add_model_components(
     m.TX_LINES_OPR_IN_PRD = Set(
         m.PERIODS,
         initialize=lambda mod, period: sorted(
-            list(set(tx for (tx, p) in mod.TX_OPR_PRDS if p == period)),
+            [tx for (tx, p) in mod.TX_OPR_PRDS if p == period],
         ),
     )
 
     m.OPR_PRDS_BY_TX_LINE = Set(
         m.TX_LINES,
         initialize=lambda mod, tx: sorted(
-            list(set(p for (l, p) in mod.TX_OPR_PRDS if l == tx)),
+            [p for (l, p) in mod.TX_OPR_PRDS if l == tx],
         ),
     )
 
@@ -169,7 +169,7 @@ def add_model_components(
     m.TX_LINES_OPR_IN_TMP = Set(
         m.TMPS,
         initialize=lambda mod, tmp: sorted(
-            list(set(tx for (tx, t) in mod.TX_OPR_TMPS if t == tmp)),
+            [tx for (tx, t) in mod.TX_OPR_TMPS if t == tmp],
         ),
     )
 
@@ -27,6 +27,7 @@ from pyomo.environ import (
     Set,
     Param,
     Var,
+    Expression,
     Constraint,
     NonNegativeReals,
     Reals,
@@ -82,6 +83,22 @@ def add_model_components(
 
     |
 
+    +-------------------------------------------------------------------------+
+    | Derived Sets                                                            |
+    +=========================================================================+
+    | | :code:`TX_SIMPLE_LOSSY`                                               |
+    |                                                                         |
+    | The set of :code:`tx_simple` transmission lines with a non-zero loss    |
+    | factor.                                                                 |
+    +-------------------------------------------------------------------------+
+    | | :code:`TX_SIMPLE_LOSSY_OPR_TMPS`                                      |
+    |                                                                         |
+    | Two-dimensional set with the :code:`tx_simple` transmission lines with  |
+    | a non-zero loss factor and their operational timepoints.                |
+    +-------------------------------------------------------------------------+
+
+    |
+
     +-------------------------------------------------------------------------+
     | Variables                                                               |
     +=========================================================================+
@@ -100,6 +117,7 @@ def add_model_components(
     | Losses on the transmission line in each timepoint, which we'll account  |
     | for in the "from" origin load zone's load balance, i.e. losses incurred |
     | when power is flowing to the "from" zone.                               |
+    | Losses are fixed to 0 on lines with a loss factor of 0.                 |
     +-------------------------------------------------------------------------+
     | | :code:`TxSimple_Losses_LZ_To_MW`                                      |
     | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
@@ -108,6 +126,25 @@ def add_model_components(
     | Losses on the transmission line in each timepoint, which we'll account  |
     | for in the "to" origin load zone's load balance, i.e. losses incurred   |
     | when power is flowing to the "to" zone.                                 |
+    | Losses are fixed to 0 on lines with a loss factor of 0.                 |
+    +-------------------------------------------------------------------------+
+
+    |
+
+    +-------------------------------------------------------------------------+
+    | Expressions                                                             |
+    +=========================================================================+
+    | | :code:`TxSimple_Min_Available_MW`                                     |
+    | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
+    |                                                                         |
+    | The transmission line's minimum capacity times its availability derate  |
+    | in each operational timepoint.                                          |
+    +-------------------------------------------------------------------------+
+    | | :code:`TxSimple_Max_Available_MW`                                     |
+    | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
+    |                                                                         |
+    | The transmission line's maximum capacity times its availability derate  |
+    | in each operational timepoint.                                          |
     +-------------------------------------------------------------------------+
 
     |
@@ -128,7 +165,7 @@ def add_model_components(
     | flow in every operational timepoint.                                    |
     +-------------------------------------------------------------------------+
     | | :code:`TxSimple_Losses_LZ_From_Constraint`                            |
-    | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
+    | | *Defined over*: :code:`TX_SIMPLE_LOSSY_OPR_TMPS`                      |
     |                                                                         |
     | Losses to be accounted for in the "from" load zone's load balance are 0 |
     | when power flow on the line is positive (power flowing from the "from"  |
@@ -136,7 +173,7 @@ def add_model_components(
     | times the loss factor otherwise (power flowing to the "from" load zone).|
     +-------------------------------------------------------------------------+
     | | :code:`TxSimple_Losses_LZ_To_Constraint`                              |
-    | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
+    | | *Defined over*: :code:`TX_SIMPLE_LOSSY_OPR_TMPS`                      |
     |                                                                         |
     | Losses to be accounted for in the "to" load zone's load balance are 0   |
     | when power flow on the line is negative (power flowing from the "to"    |
@@ -144,14 +181,14 @@ def add_model_components(
     | times the loss factor otherwise (power flowing to the "to" load zone).  |
     +-------------------------------------------------------------------------+
     | | :code:`TxSimple_Max_Losses_From_Constraint`                           |
-    | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
+    | | *Defined over*: :code:`TX_SIMPLE_LOSSY_OPR_TMPS`                      |
     |                                                                         |
     | Losses cannot exceed the maximum transmission flow capacity times the   |
     | loss factor in each operational timepoint. Provides upper bound on      |
     | losses.                                                                 |
     +-------------------------------------------------------------------------+
     | | :code:`TxSimple_Max_Losses_To_Constraint`                             |
-    | | *Defined over*: :code:`TX_SIMPLE_OPR_TMPS`                            |
+    | | *Defined over*: :code:`TX_SIMPLE_LOSSY_OPR_TMPS`                      |
     |                                                                         |
     | Losses cannot exceed the maximum transmission flow capacity times the   |
     | loss factor in each operational timepoint. Provides upper bound on      |
@@ -185,13 +222,49 @@ def add_model_components(
     ###########################################################################
     m.tx_simple_loss_factor = Param(m.TX_SIMPLE, within=PercentFraction, default=0)
 
+    # Derived Sets
+    ###########################################################################
+
+    m.TX_SIMPLE_LOSSY = Set(
+        within=m.TX_SIMPLE,
+        initialize=lambda mod: [
+            tx for tx in mod.TX_SIMPLE if mod.tx_simple_loss_factor[tx] != 0
+        ],
+    )
+
+    m.TX_SIMPLE_LOSSY_OPR_TMPS = Set(
+        dimen=2,
+        within=m.TX_SIMPLE_OPR_TMPS,
+        initialize=lambda mod: subset_init_by_set_membership(
+            mod=mod,
+            superset="TX_SIMPLE_OPR_TMPS",
+            index=0,
+            membership_set=mod.TX_SIMPLE_LOSSY,
+        ),
+    )
+
     # Variables
     ###########################################################################
 
     m.TxSimple_Transmit_Power_MW = Var(m.TX_SIMPLE_OPR_TMPS, within=Reals)
-    m.TxSimple_Losses_LZ_From_MW = Var(m.TX_SIMPLE_OPR_TMPS, within=NonNegativeReals)
+    m.TxSimple_Losses_LZ_From_MW = Var(
+        m.TX_SIMPLE_OPR_TMPS, within=NonNegativeReals, bounds=losses_bounds
+    )
 
-    m.TxSimple_Losses_LZ_To_MW = Var(m.TX_SIMPLE_OPR_TMPS, within=NonNegativeReals)
+    m.TxSimple_Losses_LZ_To_MW = Var(
+        m.TX_SIMPLE_OPR_TMPS, within=NonNegativeReals, bounds=losses_bounds
+    )
+
+    # Expressions
+    ###########################################################################
+
+    m.TxSimple_Min_Available_MW = Expression(
+        m.TX_SIMPLE_OPR_TMPS, rule=min_available_rule
+    )
+
+    m.TxSimple_Max_Available_MW = Expression(
+        m.TX_SIMPLE_OPR_TMPS, rule=max_available_rule
+    )
 
     # Constraints
     ###########################################################################
@@ -205,19 +278,64 @@ def add_model_components(
     )
 
     m.TxSimple_Losses_LZ_From_Constraint = Constraint(
-        m.TX_SIMPLE_OPR_TMPS, rule=losses_lz_from_rule
+        m.TX_SIMPLE_LOSSY_OPR_TMPS, rule=losses_lz_from_rule
     )
 
     m.TxSimple_Losses_LZ_To_Constraint = Constraint(
-        m.TX_SIMPLE_OPR_TMPS, rule=losses_lz_to_rule
+        m.TX_SIMPLE_LOSSY_OPR_TMPS, rule=losses_lz_to_rule
     )
 
     m.TxSimple_Max_Losses_From_Constraint = Constraint(
-        m.TX_SIMPLE_OPR_TMPS, rule=max_losses_from_rule
+        m.TX_SIMPLE_LOSSY_OPR_TMPS, rule=max_losses_from_rule
     )
 
     m.TxSimple_Max_Losses_To_Constraint = Constraint(
-        m.TX_SIMPLE_OPR_TMPS, rule=max_losses_to_rule
+        m.TX_SIMPLE_LOSSY_OPR_TMPS, rule=max_losses_to_rule
+    )
+
+
+# Variable Bounds Rules
+###############################################################################
+
+
+def losses_bounds(mod, l, tmp):
+    """
+    Losses are fixed to 0 on lines with a tx_simple_loss_factor of 0, so we
+    don't need the losses constraints for those lines.
+    """
+    if mod.tx_simple_loss_factor[l] == 0:
+        return 0, 0
+    else:
+        return 0, None
+
+
+# Expression Rules
+###############################################################################
+
+
+def min_available_rule(mod, l, tmp):
+    """
+    **Expression Name**: TxSimple_Min_Available_MW
+    **Defined Over**: TX_SIMPLE_OPR_TMPS
+
+    The minimum transmission flow capacity derated for availability. Built
+    once per timepoint and shared by the transmit and losses constraints.
+    """
+    return (
+        mod.Tx_Min_Capacity_MW[l, mod.period[tmp]] * mod.Tx_Availability_Derate[l, tmp]
+    )
+
+
+def max_available_rule(mod, l, tmp):
+    """
+    **Expression Name**: TxSimple_Max_Available_MW
+    **Defined Over**: TX_SIMPLE_OPR_TMPS
+
+    The maximum transmission flow capacity derated for availability. Built
+    once per timepoint and shared by the transmit and losses constraints.
+    """
+    return (
+        mod.Tx_Max_Capacity_MW[l, mod.period[tmp]] * mod.Tx_Availability_Derate[l, tmp]
     )
 
 
@@ -236,9 +354,7 @@ def min_transmit_rule(mod, l, tmp):
     each operational timepoint.
     """
     return (
-        mod.TxSimple_Transmit_Power_MW[l, tmp]
-        >= mod.Tx_Min_Capacity_MW[l, mod.period[tmp]]
-        * mod.Tx_Availability_Derate[l, tmp]
+        mod.TxSimple_Transmit_Power_MW[l, tmp] >= mod.TxSimple_Min_Available_MW[l, tmp]
     )
 
 
@@ -251,16 +367,14 @@ def max_transmit_rule(mod, l, tmp):
     each operational timepoint.
     """
     return (
-        mod.TxSimple_Transmit_Power_MW[l, tmp]
-        <= mod.Tx_Max_Capacity_MW[l, mod.period[tmp]]
-        * mod.Tx_Availability_Derate[l, tmp]
+        mod.TxSimple_Transmit_Power_MW[l, tmp] <= mod.TxSimple_Max_Available_MW[l, tmp]
     )
 
 
 def losses_lz_from_rule(mod, l, tmp):
     """
     **Constraint Name**: TxSimple_Losses_LZ_From_Constraint
-    **Enforced Over**: TX_SIMPLE_OPR_TMPS
+    **Enforced Over**: TX_SIMPLE_LOSSY_OPR_TMPS
 
     Losses for the 'from' load zone of this transmission line (non-negative
     variable) must be greater than or equal to the negative of the flow times
@@ -268,80 +382,64 @@ def losses_lz_from_rule(mod, l, tmp):
     to the 'from', so losses are positive. When the flow on the line is
     positive (i.e. power flowing from the 'from' load zone), losses can be set
     to zero.
-    If the tx_simple_loss_factor is 0, losses are set to 0.
     WARNING: since we have a greater than or equal constraint here, whenever
     tx_simple_loss_factor is not 0, the model can incur line losses that are
     not actually real.
     """
-    if mod.tx_simple_loss_factor[l] == 0:
-        return mod.TxSimple_Losses_LZ_From_MW[l, tmp] == 0
-    else:
-        return (
-            mod.TxSimple_Losses_LZ_From_MW[l, tmp]
-            >= -mod.TxSimple_Transmit_Power_MW[l, tmp] * mod.tx_simple_loss_factor[l]
-        )
+    return (
+        mod.TxSimple_Losses_LZ_From_MW[l, tmp]
+        # Negate the (immutable, i.e. numeric) loss factor rather than the
+        # variable, so Pyomo builds a single monomial term
+        >= -mod.tx_simple_loss_factor[l] * mod.TxSimple_Transmit_Power_MW[l, tmp]
+    )
 
 
 def losses_lz_to_rule(mod, l, tmp):
     """
     **Constraint Name**: TxSimple_Losses_LZ_To_Constraint
-    **Enforced Over**: TX_SIMPLE_OPR_TMPS
+    **Enforced Over**: TX_SIMPLE_LOSSY_OPR_TMPS
 
     Losses for the 'to' load zone of this transmission line (non-negative
     variable) must be greater than or equal to the flow times the loss
     factor. When the flow on the line is positive, power is flowing to the
     'to' LZ, so losses are positive. When the flow on the line is negative
     (i.e. power flowing from the 'to' load zone), losses can be set to zero.
-    If the tx_simple_loss_factor is 0, losses are set to 0.
     WARNING: since we have a greater than or equal constraint here, whenever
     tx_simple_loss_factor is not 0, the model can incur line losses that are
     not actually real.
     """
-    if mod.tx_simple_loss_factor[l] == 0:
-        return mod.TxSimple_Losses_LZ_To_MW[l, tmp] == 0
-    else:
-        return (
-            mod.TxSimple_Losses_LZ_To_MW[l, tmp]
-            >= mod.TxSimple_Transmit_Power_MW[l, tmp] * mod.tx_simple_loss_factor[l]
-        )
+    return (
+        mod.TxSimple_Losses_LZ_To_MW[l, tmp]
+        >= mod.tx_simple_loss_factor[l] * mod.TxSimple_Transmit_Power_MW[l, tmp]
+    )
 
 
 def max_losses_from_rule(mod, l, tmp):
     """
     **Constraint Name**: TxSimple_Max_Losses_From_Constraint
-    **Enforced Over**: TX_SIMPLE_OPR_TMPS
+    **Enforced Over**: TX_SIMPLE_LOSSY_OPR_TMPS
 
     Losses cannot exceed the maximum transmission flow capacity times the
     loss factor in each operational timepoint. Provides upper bound on losses.
     """
-    if mod.tx_simple_loss_factor[l] == 0:
-        return mod.TxSimple_Losses_LZ_From_MW[l, tmp] == 0
-    else:
-        return (
-            mod.TxSimple_Losses_LZ_From_MW[l, tmp]
-            <= -mod.Tx_Min_Capacity_MW[l, mod.period[tmp]]
-            * mod.Tx_Availability_Derate[l, tmp]
-            * mod.tx_simple_loss_factor[l]
-        )
+    return (
+        mod.TxSimple_Losses_LZ_From_MW[l, tmp]
+        <= -mod.TxSimple_Min_Available_MW[l, tmp] * mod.tx_simple_loss_factor[l]
+    )
 
 
 def max_losses_to_rule(mod, l, tmp):
     """
     **Constraint Name**: TxSimple_Max_Losses_To_Constraint
-    **Enforced Over**: TX_SIMPLE_OPR_TMPS
+    **Enforced Over**: TX_SIMPLE_LOSSY_OPR_TMPS
 
     Losses cannot exceed the maximum transmission flow capacity times the
     loss factor in each operational timepoint. Provides upper bound on losses.
     """
-    if mod.tx_simple_loss_factor[l] == 0:
-        return mod.TxSimple_Losses_LZ_To_MW[l, tmp] == 0
-    else:
-        return (
-            mod.TxSimple_Losses_LZ_To_MW[l, tmp]
-            <= mod.Tx_Max_Capacity_MW[l, mod.period[tmp]]
-            * mod.Tx_Availability_Derate[l, tmp]
-            * mod.tx_simple_loss_factor[l]
-        )
+    return (
+        mod.TxSimple_Losses_LZ_To_MW[l, tmp]
+        <= mod.TxSimple_Max_Available_MW[l, tmp] * mod.tx_simple_loss_factor[l]
+    )
 
 
 # Transmission Operational Type Methods
@@ -416,19 +514,20 @@ def load_model_data(
         ),
         sep="\t",
         usecols=["transmission_line", "tx_operational_type", "tx_simple_loss_factor"],
+        keep_default_na=False,
+        na_values=["."],
+    )
+
+    # Remove lines of other operational types and any missing loss factor data
+    # (will default to 0 in the model)
+    df = df[
+        (df["tx_operational_type"] == "tx_simple") & df["tx_simple_loss_factor"].notna()
+    ]
+
+    # Dict of loss factor by tx_simple line
+    loss_factor = dict(
+        zip(df["transmission_line"], df["tx_simple_loss_factor"].astype(float))
     )
-    df = df[df["tx_operational_type"] == "tx_simple"]
-
-    # Dict of loss factor by tx_simple line based on raw data
-    loss_factor_raw = dict(zip(df["transmission_line"], df["tx_simple_loss_factor"]))
-
-    # Convert loss factors to float and remove any missing data (will
-    # default to 0 in the model)
-    loss_factor = {
-        line: float(loss_factor_raw[line])
-        for line in loss_factor_raw
-        if loss_factor_raw[line] != "."
-    }
 
     # Load data
     data_portal.data()["tx_simple_loss_factor"] = loss_factor
@@ -213,26 +213,13 @@ def load_model_data(
     )
 
     if os.path.exists(transmission_flow_limits_file):
+        # Read the file once; both flow limit columns are optional
+        df = pd.read_csv(transmission_flow_limits_file, sep="\t")
+
         # Min Flow
         transmission_tmps_with_min = list()
         min_flow_mw = dict()
 
-        header = pd.read_csv(
-            transmission_flow_limits_file,
-            sep="\t",
-            header=None,
-            nrows=1,
-        ).values[0]
-
-        optional_columns = ["min_flow_mw"]
-        used_columns = [c for c in optional_columns if c in header]
-
-        df = pd.read_csv(
-            transmission_flow_limits_file,
-            sep="\t",
-            usecols=["transmission_line", "timepoint"] + used_columns,
-        )
-
         # min_flow_mw is optional,
         # so TX_SIMPLE_OPR_TMPS_W_MIN_CONSTRAINT
         # and min_flow_mw simply won't be initialized if
@@ -259,22 +246,6 @@ def load_model_data(
         transmission_tmps_with_max = list()
         max_flow_mw = dict()
 
-        header = pd.read_csv(
-            transmission_flow_limits_file,
-            sep="\t",
-            header=None,
-            nrows=1,
-        ).values[0]
-
-        optional_columns = ["max_flow_mw"]
-        used_columns = [c for c in optional_columns if c in header]
-
-        df = pd.read_csv(
-            transmission_flow_limits_file,
-            sep="\t",
-            usecols=["transmission_line", "timepoint"] + used_columns,
-        )
-
         # max_flow_mw is optional,
         # so TX_SIMPLE_OPR_TMPS_W_MAX_CONSTRAINT
         # and max_flow_mw simply won't be initialized if
@@ -318,26 +289,28 @@ def get_model_inputs_from_database(
 
     c = conn.cursor()
     tx_flow = c.execute(
-        """SELECT transmission_line, timepoint, min_flow_mw, max_flow_mw
+        """SELECT transmission_line, timepoint,
+        COALESCE(min_flow_mw, '.'), COALESCE(max_flow_mw, '.')
         FROM inputs_transmission_flow
         JOIN
         (SELECT timepoint
         FROM inputs_temporal
-        WHERE temporal_scenario_id = {}) as relevant_timepoints
-        USING (timepoint)        
+        WHERE temporal_scenario_id = ?) as relevant_timepoints
+        USING (timepoint)
         JOIN
         (SELECT transmission_line
         FROM inputs_transmission_portfolios
-        WHERE transmission_portfolio_scenario_id = {}) as relevant_tx
+        WHERE transmission_portfolio_scenario_id = ?) as relevant_tx
         USING (transmission_line)
-        WHERE transmission_flow_scenario_id = {}
-        AND stage_ID = {}
-        """.format(
+        WHERE transmission_flow_scenario_id = ?
+        AND stage_ID = ?
+        """,
+        (
             subscenarios.TEMPORAL_SCENARIO_ID,
             subscenarios.TRANSMISSION_PORTFOLIO_SCENARIO_ID,
             subscenarios.TRANSMISSION_FLOW_SCENARIO_ID,
             stage,
-        )
+        ),
     )
 
     return tx_flow
@@ -383,10 +356,12 @@ def write_model_inputs(
         db_subproblem,
         db_stage,
         conn,
-    ).fetchall()
+    )
 
-    # Only write tab file if we have data to limit flows
-    if len(tx_flow) > 0:
+    # Only write tab file if we have data to limit flows; peek at the first
+    # row rather than fetching all rows to check
+    first_row = tx_flow.fetchone()
+    if first_row is not None:
         with open(
             os.path.join(
                 scenario_directory,
@@ -408,6 +383,6 @@ def write_model_inputs(
                 ["transmission_line", "timepoint", "min_flow_mw", "max_flow_mw"]
             )
 
-            for row in tx_flow:
-                replace_nulls = ["." if i is None else i for i in row]
-                writer.writerow(replace_nulls)
+            # NULLs are already replaced with "." in the query
+            writer.writerow(first_row)
+            writer.writerows(tx_flow)
@@ -48,6 +48,42 @@ class TestAuxiliary(unittest.TestCase):
         )
         self.assertListEqual(two_sets_joined_expected, two_sets_joined_actual)
 
+    def test_subset_init_by_param_value(self):
+        """
+
+        :return:
+        """
+        mod = AbstractModel()
+        mod.TX_LINES = ["tx1", "tx2", "tx3"]
+        mod.tx_operational_type = {
+            "tx1": "tx_simple",
+            "tx2": "tx_dcopf",
+            "tx3": "tx_simple",
+        }
+
+        expected = ["tx1", "tx3"]
+        actual = auxiliary_module_to_test.subset_init_by_param_value(
+            mod=mod,
+            set_name="TX_LINES",
+            param_name="tx_operational_type",
+            param_value="tx_simple",
+        )
+        self.assertListEqual(expected, actual)
+
+    def test_subset_init_by_set_membership(self):
+        """
+
+        :return:
+        """
+        mod = AbstractModel()
+        mod.PRJ_TMPS = [("a", 1), ("b", 1), ("a", 2), ("c", 2)]
+
+        expected = [("a", 1), ("a", 2), ("c", 2)]
+        actual = auxiliary_module_to_test.subset_init_by_set_membership(
+            mod=mod, superset="PRJ_TMPS", index=0, membership_set=["a", "c"]
+        )
+        self.assertListEqual(expected, actual)
+
     def test_check_list_has_single_item(self):
         """
 
@@ -0,0 +1,202 @@
+# Copyright 2016-2024 Blue Marble Analytics LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import csv
+import os.path
+import sqlite3
+import tempfile
+import unittest
+
+from data_toolkit.project.availability import (
+    eia860_to_project_availability_input_csvs as module_to_test,
+)
+from data_toolkit.project.project_data_filters_common import (
+    get_eia860_sql_filter_params,
+)
+
+HEADER = [
+    "project",
+    "availability_type",
+    "exogenous_availability_independent_scenario_id",
+    "exogenous_availability_weather_scenario_id",
+    "endogenous_availability_scenario_id",
+]
+
+
+def create_raw_data(conn):
+    """
+    :param conn: the database connection
+
+    Create and populate the raw EIA 860 and user-defined tables the
+    availability query reads from.
+    """
+    conn.executescript(
+        """
+        CREATE TABLE user_defined_baa_key (baa TEXT, region TEXT);
+        CREATE TABLE user_defined_eia_gridpath_key (
+            prime_mover_code TEXT, energy_source_code TEXT,
+            gridpath_operational_type TEXT, agg_project TEXT
+        );
+        CREATE TABLE raw_data_eia860_generators (
+            plant_id_eia INTEGER, generator_id TEXT,
+            current_planned_generator_operating_date TEXT,
+            generator_retirement_date TEXT,
+            balancing_authority_code_eia TEXT, operational_status_code TEXT,
+            prime_mover_code TEXT, energy_source_code_1 TEXT
+        );
+        """
+    )
+    conn.executemany(
+        "INSERT INTO user_defined_baa_key VALUES (?, ?);",
+        [("BAA1", "WECC"), ("BAA2", "WECC"), ("BAA3", "ERCOT")],
+    )
+    conn.executemany(
+        "INSERT INTO user_defined_eia_gridpath_key VALUES (?, ?, ?, ?);",
+        [
+            ("GT", "NG", "gen_commit_lin", "gas_ct"),
+            ("PV", "SUN", "gen_var", "solar"),
+            ("HY", "WAT", "gen_hydro", "hydro"),
+        ],
+    )
+    conn.executemany(
+        "INSERT INTO raw_data_eia860_generators VALUES (?, ?, ?, ?, ?, ?, ?, ?);",
+        [
+            # Disaggregated unit
+            (1, "CT 1", "2000-01-01", None, "BAA1", "OP", "GT", "NG"),
+            # Disaggregated unit retired in 2020
+            (2, "CT-2", "2000-01-01", "2020-06-30", "BAA1", "OP", "GT", "NG"),
+            # Solar units are aggregated by balancing authority
+            (3, "PV1", "2010-05-01", None, "BAA1", "OP", "PV", "SUN"),
+            (4, "PV2", "2015-05-01", None, "BAA1", "OP", "PV", "SUN"),
+            (5, "HY1", "1950-01-01", None, "BAA2", "OP", "HY", "WAT"),
+            # Planned unit
+            (6, "CT1", "2030-01-01", None, "BAA1", "P", "GT", "NG"),
+            # Unit in another region
+            (7, "CT1", "2000-01-01", None, "BAA3", "OP", "GT", "NG"),
+        ],
+    )
+    conn.commit()
+
+
+def read_availability_csv(csv_path):
+    """
+    :param csv_path: path to the availability CSV
+    :return: the header and the sorted data rows
+    """
+    with open(csv_path, "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = sorted(reader)
+
+    return header, rows
+
+
+class TestEIA860ToProjectAvailabilityInputCSVs(unittest.TestCase):
+    """ """
+
+    def test_get_project_availability(self):
+        """
+        Check the CSV rows written for the projects that pass the EIA 860
+        filters
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        create_raw_data(conn)
+
+        with tempfile.TemporaryDirectory() as csv_location:
+            module_to_test.get_project_availability(
+                conn=conn,
+                eia860_sql_filter_params=get_eia860_sql_filter_params(
+                    study_year=2026, region="WECC"
+                ),
+                csv_location=csv_location,
+                subscenario_id=1,
+                subscenario_name="no_derates",
+            )
+            header, rows = read_availability_csv(
+                os.path.join(csv_location, "1_no_derates.csv")
+            )
+        conn.close()
+
+        self.assertListEqual(HEADER, header)
+        self.assertListEqual(
+            [
+                ["1__CT_1", "exogenous", "", "", ""],
+                ["hydro_BAA2", "exogenous", "", "", ""],
+                ["solar_BAA1", "exogenous", "", "", ""],
+            ],
+            rows,
+        )
+
+    def test_main_scenarios_csv(self):
+        """
+        Check that a CSV is written for each row of the scenarios CSV
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = os.path.join(temp_dir, "raw.db")
+            conn = sqlite3.connect(db_path)
+            create_raw_data(conn)
+            conn.close()
+
+            scenarios_csv = os.path.join(temp_dir, "scenarios.csv")
+            with open(scenarios_csv, "w", newline="") as f:
+                f.write(
+                    "study_year,region,project_availability_scenario_id,"
+                    "project_availability_scenario_name\n"
+                    "2018,WECC,2,wecc_2018\n"
+                    "2026,ERCOT,3,ercot_2026\n"
+                )
+
+            output_directory = os.path.join(temp_dir, "availability")
+            module_to_test.main(
+                [
+                    "--database",
+                    db_path,
+                    "--output_directory",
+                    output_directory,
+                    "--scenarios_csv",
+                    scenarios_csv,
+                    "--quiet",
+                ]
+            )
+
+            self.assertListEqual(
+                ["2_wecc_2018.csv", "3_ercot_2026.csv"],
+                sorted(os.listdir(output_directory)),
+            )
+
+            header, rows = read_availability_csv(
+                os.path.join(output_directory, "2_wecc_2018.csv")
+            )
+            self.assertListEqual(HEADER, header)
+            self.assertListEqual(
+                [
+                    ["1__CT_1", "exogenous", "", "", ""],
+                    ["2__CT_2", "exogenous", "", "", ""],
+                    ["hydro_BAA2", "exogenous", "", "", ""],
+                    ["solar_BAA1", "exogenous", "", "", ""],
+                ],
+                rows,
+            )
+
+            header, rows = read_availability_csv(
+                os.path.join(output_directory, "3_ercot_2026.csv")
+            )
+            self.assertListEqual(HEADER, header)
+            self.assertListEqual([["7__CT1", "exogenous", "", "", ""]], rows)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 
-from collections import OrderedDict
 from importlib import import_module
 import os.path
 import sys
@@ -127,55 +126,39 @@ class TestHorizonEnergyTarget(unittest.TestCase):
         self.assertListEqual(expected_p_zone_bt_horizons, actual_p_zone_bt_horizons)
 
         # Param: policy_requirement
-        expected_req = OrderedDict(
-            sorted(
-                {
-                    ("RPS", "RPSZone1", "year", 2020): 250000,
-                    ("RPS", "RPSZone1", "year", 2030): 0,
-                    ("Carbon", "CarbonZone1", "year", 2020): 0,
-                    ("Carbon", "CarbonZone1", "year", 2030): 200000,
-                }.items()
-            )
-        )
-        actual_req = OrderedDict(
-            sorted(
-                {
-                    (p, z, bt, h): instance.policy_requirement[p, z, bt, h]
-                    for (
-                        p,
-                        z,
-                        bt,
-                        h,
-                    ) in instance.POLICIES_ZONE_BLN_TYPE_HRZS_WITH_REQ
-                }.items()
-            )
-        )
+        expected_req = {
+            ("RPS", "RPSZone1", "year", 2020): 250000,
+            ("RPS", "RPSZone1", "year", 2030): 0,
+            ("Carbon", "CarbonZone1", "year", 2020): 0,
+            ("Carbon", "CarbonZone1", "year", 2030): 200000,
+        }
+        actual_req = {
+            (p, z, bt, h): instance.policy_requirement[p, z, bt, h]
+            for (
+                p,
+                z,
+                bt,
+                h,
+            ) in instance.POLICIES_ZONE_BLN_TYPE_HRZS_WITH_REQ
+        }
         self.assertDictEqual(expected_req, actual_req)
 
         # Param: policy_requirement_f_load_coeff
-        expected_req_fl = OrderedDict(
-            sorted(
-                {
-                    ("RPS", "RPSZone1", "year", 2020): 0,
-                    ("RPS", "RPSZone1", "year", 2030): 0.8,
-                    ("Carbon", "CarbonZone1", "year", 2020): 0.9,
-                    ("Carbon", "CarbonZone1", "year", 2030): 0,
-                }.items()
-            )
-        )
-        actual_req_fl = OrderedDict(
-            sorted(
-                {
-                    (p, z, bt, h): instance.policy_requirement_f_load_coeff[p, z, bt, h]
-                    for (
-                        p,
-                        z,
-                        bt,
-                        h,
-                    ) in instance.POLICIES_ZONE_BLN_TYPE_HRZS_WITH_REQ
-                }.items()
-            )
-        )
+        expected_req_fl = {
+            ("RPS", "RPSZone1", "year", 2020): 0,
+            ("RPS", "RPSZone1", "year", 2030): 0.8,
+            ("Carbon", "CarbonZone1", "year", 2020): 0.9,
+            ("Carbon", "CarbonZone1", "year", 2030): 0,
+        }
+        actual_req_fl = {
+            (p, z, bt, h): instance.policy_requirement_f_load_coeff[p, z, bt, h]
+            for (
+                p,
+                z,
+                bt,
+                h,
+            ) in instance.POLICIES_ZONE_BLN_TYPE_HRZS_WITH_REQ
+        }
         self.assertDictEqual(expected_req_fl, actual_req_fl)
 
 
@@ -16,7 +16,10 @@
 from collections import OrderedDict
 from importlib import import_module
 import os.path
+import shutil
+import sqlite3
 import sys
+import tempfile
 import unittest
 
 from tests.common_functions import create_abstract_model, add_components_and_load_data
@@ -24,6 +27,9 @@ from tests.common_functions import create_abstract_model, add_components_and_loa
 TEST_DATA_DIRECTORY = os.path.join(
     os.path.dirname(__file__), "..", "..", "..", "test_data"
 )
+DB_SCHEMA = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "..", "db", "db_schema.sql"
+)
 
 # Import prerequisite modules
 PREREQUISITE_MODULE_NAMES = [
@@ -179,6 +185,173 @@ class TestCapacityContributionTransfers(unittest.TestCase):
 
         self.assertDictEqual(expected_to, actual_to)
 
+        # Set: PRM_TX_ZONE_PAIRS
+        expected_zone_pairs = sorted(
+            [("PRM_Zone1", "PRM_Zone2"), ("PRM_Zone2", "PRM_Zone1")]
+        )
+        actual_zone_pairs = sorted(
+            [(z, z_to) for (z, z_to) in instance.PRM_TX_ZONE_PAIRS]
+        )
+
+        self.assertListEqual(expected_zone_pairs, actual_zone_pairs)
+
+        # Set: PRM_TX_LINES_BY_PRM_ZONE_PAIR
+        expected_tx_by_zone_pair = {
+            ("PRM_Zone1", "PRM_Zone2"): ["Tx1"],
+            ("PRM_Zone2", "PRM_Zone1"): ["Tx_New"],
+        }
+        actual_tx_by_zone_pair = {
+            (z, z_to): sorted(
+                [tx for tx in instance.PRM_TX_LINES_BY_PRM_ZONE_PAIR[z, z_to]]
+            )
+            for (z, z_to) in instance.PRM_TX_ZONE_PAIRS
+        }
+
+        self.assertDictEqual(expected_tx_by_zone_pair, actual_tx_by_zone_pair)
+
+        # Set: PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE
+        expected_to_zones = {"PRM_Zone1": ["PRM_Zone2"], "PRM_Zone2": []}
+        actual_to_zones = {
+            z: sorted([t_z for t_z in instance.PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE[z]])
+            for z in instance.PRM_ZONES
+        }
+
+        self.assertDictEqual(expected_to_zones, actual_to_zones)
+
+        # Set: PRM_TRANSFER_FROM_ZONES_BY_PRM_ZONE
+        expected_from_zones = {"PRM_Zone1": [], "PRM_Zone2": ["PRM_Zone1"]}
+        actual_from_zones = {
+            z: sorted([f_z for f_z in instance.PRM_TRANSFER_FROM_ZONES_BY_PRM_ZONE[z]])
+            for z in instance.PRM_ZONES
+        }
+
+        self.assertDictEqual(expected_from_zones, actual_from_zones)
+
+    def test_numeric_ids(self):
+        """
+        Check that numeric-looking PRM zone and transmission line names are
+        loaded as the same values as by Pyomo's tab reader, which converts
+        them to integers
+        :return:
+        """
+        # Rename the PRM zones and transmission lines in a copy of the test
+        # data inputs
+        new_names = {"PRM_Zone1": "1", "PRM_Zone2": "2", "Tx1": "1", "Tx_New": "2"}
+        with tempfile.TemporaryDirectory() as test_data_dir:
+            inputs_directory = os.path.join(test_data_dir, "inputs")
+            shutil.copytree(
+                os.path.join(TEST_DATA_DIRECTORY, "inputs"), inputs_directory
+            )
+            for f in os.listdir(inputs_directory):
+                if f.endswith(".tab"):
+                    with open(os.path.join(inputs_directory, f), "r") as tab_file:
+                        lines = tab_file.read().splitlines()
+                    with open(os.path.join(inputs_directory, f), "w") as tab_file:
+                        for line in lines:
+                            tab_file.write(
+                                "\t".join(
+                                    new_names.get(field, field)
+                                    for field in line.split("\t")
+                                )
+                                + "\n"
+                            )
+
+            m, data = add_components_and_load_data(
+                prereq_modules=IMPORTED_PREREQ_MODULES,
+                module_to_test=MODULE_BEING_TESTED,
+                test_data_dir=test_data_dir,
+                weather_iteration="",
+                hydro_iteration="",
+                availability_iteration="",
+                subproblem="",
+                stage="",
+            )
+            instance = m.create_instance(data)
+
+        self.assertListEqual([1, 2], sorted(instance.PRM_TX_LINES))
+        self.assertDictEqual(
+            {1: (1, 2), 2: (2, 1)},
+            {
+                tx: (instance.prm_zone_from[tx], instance.prm_zone_to[tx])
+                for tx in instance.PRM_TX_LINES
+            },
+        )
+        self.assertDictEqual(
+            {(1, 2): [1], (2, 1): [2]},
+            {
+                (z, z_to): sorted(instance.PRM_TX_LINES_BY_PRM_ZONE_PAIR[z, z_to])
+                for (z, z_to) in instance.PRM_TX_ZONE_PAIRS
+            },
+        )
+        self.assertDictEqual(
+            {1: [2], 2: []},
+            {
+                z: sorted(instance.PRM_TRANSFER_TO_ZONES_BY_PRM_ZONE[z])
+                for z in instance.PRM_ZONES
+            },
+        )
+        self.assertDictEqual(
+            {1: [], 2: [1]},
+            {
+                z: sorted(instance.PRM_TRANSFER_FROM_ZONES_BY_PRM_ZONE[z])
+                for z in instance.PRM_ZONES
+            },
+        )
+        self.assertEqual(99, instance.max_transfer_powerunit[1, 2, 2020])
+
+    def test_import_results_into_database(self):
+        """
+        Check that the results CSV is imported into
+        results_system_capacity_transfers with the iteration, subproblem,
+        and stage values the results directories map to
+        :return:
+        """
+        conn = sqlite3.connect(":memory:")
+        with open(DB_SCHEMA, "r") as db_schema_script:
+            conn.executescript(db_schema_script.read())
+
+        with tempfile.TemporaryDirectory() as results_directory:
+            with open(
+                os.path.join(results_directory, "capacity_contribution_transfers.csv"),
+                "w",
+                newline="",
+            ) as results_file:
+                results_file.write(
+                    "prm_zone_from,prm_zone_to,period,capacity_transfer_mw,"
+                    "capacity_transfer_cost_per_yr_in_period\n"
+                    "PRM_Zone1,PRM_Zone2,2020,10.0,100.0\n"
+                    "PRM_Zone1,PRM_Zone2,2030,0.0,0.0\n"
+                )
+
+            MODULE_BEING_TESTED.import_results_into_database(
+                scenario_id=1,
+                weather_iteration="",
+                hydro_iteration="",
+                availability_iteration="",
+                subproblem="",
+                stage="",
+                c=conn.cursor(),
+                db=conn,
+                results_directory=results_directory,
+                quiet=True,
+            )
+
+        expected_rows = [
+            (1, 0, 0, 0, 1, 1, "PRM_Zone1", "PRM_Zone2", 2020, 10.0, 100.0),
+            (1, 0, 0, 0, 1, 1, "PRM_Zone1", "PRM_Zone2", 2030, 0.0, 0.0),
+        ]
+        actual_rows = conn.execute(
+            """SELECT scenario_id, weather_iteration, hydro_iteration,
+            availability_iteration, subproblem_id, stage_id, prm_zone_from,
+            prm_zone_to, period, capacity_transfer_mw,
+            capacity_transfer_cost_per_yr_in_period
+            FROM results_system_capacity_transfers
+            ORDER BY period;"""
+        ).fetchall()
+        conn.close()
+
+        self.assertListEqual(expected_rows, actual_rows)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,6 +17,7 @@ from importlib import import_module
 import os.path
 import pandas as pd
 import sys
+from types import SimpleNamespace
 import unittest
 
 from tests.common_functions import create_abstract_model, add_components_and_load_data
@@ -347,6 +348,46 @@ class TestWaterFlows(unittest.TestCase):
 
         self.assertListEqual(expected_wl_dp_arr_tmp, actual_wl_dp_arr_tmp)
 
+        # Set: WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MIN_CONSTRAINT
+        expected_w_min = [
+            (wl, dep_tmp, arr_tmp)
+            for (wl, dep_tmp, arr_tmp) in expected_wl_dp_arr_tmp
+            if wl == "Water_Link_12"  # only link allowing min flow violations
+            and expected_min_bound.get((wl, dep_tmp), 0) > 0
+        ]
+        actual_w_min = sorted(
+            [
+                (wl, dep_tmp, arr_tmp)
+                for (
+                    wl,
+                    dep_tmp,
+                    arr_tmp,
+                ) in instance.WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MIN_CONSTRAINT
+            ]
+        )
+
+        self.assertListEqual(expected_w_min, actual_w_min)
+
+        # Set: WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MAX_CONSTRAINT
+        expected_w_max = [
+            (wl, dep_tmp, arr_tmp)
+            for (wl, dep_tmp, arr_tmp) in expected_wl_dp_arr_tmp
+            if wl == "Water_Link_23"  # only link allowing max flow violations
+            and expected_max_bound.get((wl, dep_tmp), float("inf")) != float("inf")
+        ]
+        actual_w_max = sorted(
+            [
+                (wl, dep_tmp, arr_tmp)
+                for (
+                    wl,
+                    dep_tmp,
+                    arr_tmp,
+                ) in instance.WATER_LINK_DEPARTURE_ARRIVAL_TMPS_W_MAX_CONSTRAINT
+            ]
+        )
+
+        self.assertListEqual(expected_w_max, actual_w_max)
+
         # Param: departure_timepoint
         expected_dep_tmp = {
             ("Water_Link_12", 20200101): 20200122,
@@ -756,3 +797,71 @@ class TestWaterFlows(unittest.TestCase):
         }
 
         self.assertDictEqual(expected_arr_tmp, actual_arr_tmp)
+
+    def test_determine_arrival_timepoints(self):
+        """
+        Check the arrival timepoints against hand-computed values for a
+        linear and a circular horizon, including travel times that cross the
+        horizon boundary
+        :return:
+        """
+        # Horizon 1 is linear with timepoints of 1, 1, 2, and 1 hours; horizon
+        # 2 is circular with three 1-hour timepoints
+        mod = SimpleNamespace(
+            water_system_balancing_type="day",
+            hrs_in_tmp={1: 1, 2: 1, 3: 2, 4: 1, 5: 1, 6: 1, 7: 1},
+            HRZS_BY_BLN_TYPE={"day": [1, 2]},
+            TMPS_BY_BLN_TYPE_HRZ={("day", 1): [1, 2, 3, 4], ("day", 2): [5, 6, 7]},
+            boundary={("day", 1): "linear", ("day", 2): "circular"},
+        )
+
+        expected_arr_tmps_by_travel_time = {
+            # Shorter than all timepoints: balance within the departure tmp
+            0.5: {1: 1, 2: 2, 3: 3, 4: 4, 5: 5, 6: 6, 7: 7},
+            # Tmp 3 is 2 hours long, so flows departing in tmp 3 balance
+            # within it
+            1.5: {
+                1: 3,
+                2: 4,
+                3: 3,
+                4: "tmp_outside_horizon",
+                5: 7,
+                6: 5,
+                7: 6,
+            },
+            2: {
+                1: 3,
+                2: 4,
+                3: 4,
+                4: "tmp_outside_horizon",
+                5: 7,
+                6: 5,
+                7: 6,
+            },
+            # In the circular horizon, flows arrive back in the departure tmp
+            3: {
+                1: 4,
+                2: 4,
+                3: "tmp_outside_horizon",
+                4: "tmp_outside_horizon",
+                5: 5,
+                6: 6,
+                7: 7,
+            },
+            # Longer than the circular horizon
+            4: {
+                1: 4,
+                2: "tmp_outside_horizon",
+                3: "tmp_outside_horizon",
+                4: "tmp_outside_horizon",
+                5: "tmp_outside_horizon",
+                6: "tmp_outside_horizon",
+                7: "tmp_outside_horizon",
+            },
+        }
+
+        for travel_time, expected_arr_tmps in expected_arr_tmps_by_travel_time.items():
+            actual_arr_tmps = MODULE_BEING_TESTED.determine_arrival_timepoints(
+                mod=mod, travel_time_hours=travel_time
+            )
+            self.assertDictEqual(expected_arr_tmps, actual_arr_tmps)
@@ -16,7 +16,9 @@
 from importlib import import_module
 import os.path
 import pandas as pd
+import shutil
 import sys
+import tempfile
 import unittest
 
 from tests.common_functions import create_abstract_model, add_components_and_load_data
@@ -254,6 +256,40 @@ class TestPeriods(unittest.TestCase):
             "param not loaded correctly",
         )
 
+    def test_timepoint_period_not_in_periods(self):
+        """
+        Check that a timepoint whose period is not in periods.tab raises a
+        ValueError
+        :return:
+        """
+        with tempfile.TemporaryDirectory() as test_data_dir:
+            os.makedirs(os.path.join(test_data_dir, "inputs"))
+            shutil.copy(
+                os.path.join(TEST_DATA_DIRECTORY, "inputs", "timepoints.tab"),
+                os.path.join(test_data_dir, "inputs", "timepoints.tab"),
+            )
+            # Drop the 2030 period
+            periods_df = pd.read_csv(
+                os.path.join(TEST_DATA_DIRECTORY, "inputs", "periods.tab"), sep="\t"
+            )
+            periods_df[periods_df["period"] != 2030].to_csv(
+                os.path.join(test_data_dir, "inputs", "periods.tab"),
+                sep="\t",
+                index=False,
+            )
+
+            with self.assertRaises(ValueError):
+                add_components_and_load_data(
+                    prereq_modules=IMPORTED_PREREQ_MODULES,
+                    module_to_test=MODULE_BEING_TESTED,
+                    test_data_dir=test_data_dir,
+                    weather_iteration="",
+                    hydro_iteration="",
+                    availability_iteration="",
+                    subproblem="",
+                    stage="",
+                )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -230,6 +230,17 @@ class TestTxOperations(unittest.TestCase):
         )
         self.assertDictEqual(expected_lf, actual_lf)
 
+        # Set: TX_SIMPLE_LOSSY
+        expected_lossy_tx = sorted(["Tx_New"])
+        actual_lossy_tx = sorted(instance.TX_SIMPLE_LOSSY)
+        self.assertListEqual(expected_lossy_tx, actual_lossy_tx)
+
+        # Set: TX_SIMPLE_LOSSY_OPR_TMPS
+        actual_lossy_tx_op_tmp = sorted(
+            [(tx, tmp) for (tx, tmp) in instance.TX_SIMPLE_LOSSY_OPR_TMPS]
+        )
+        self.assertListEqual(expect_tx_op_tmp, actual_lossy_tx_op_tmp)
+
 
 if __name__ == "__main__":
     unittest.main()